@@ -1,18 +1,44 @@
 """Configuration loader for quadruped robot firmware."""
 
+import functools
+import json
 import yaml
 from pathlib import Path
 from typing import Dict, Any
 from src.utils.exceptions import ConfigError
 from src.utils.logger import get_logger
 
+# Prefer the libyaml-backed loader, fall back to the pure-Python one
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+_YAML_LOAD = functools.partial(yaml.load, Loader=_SafeLoader)
+
 logger = get_logger(__name__)
 
 
+def _cache_path(config_file: Path) -> Path:
+    """
+    Get path to the JSON cache stored next to a YAML configuration file.
+
+    Args:
+        config_file: Path to YAML configuration file
+
+    Returns:
+        Path to JSON cache file (e.g. robot_config.yaml.json)
+    """
+    return config_file.with_name(f"{config_file.name}.json")
+
+
 def load_config(config_file: Path) -> Dict[str, Any]:
     """
     Load configuration from YAML file.
 
+    The parsed configuration is cached as JSON next to the YAML file and
+    reused while the cache is not older than the YAML source.
+
     Args:
         config_file: Path to YAML configuration file
 
@@ -26,12 +52,33 @@ def load_config(config_file: Path) -> Dict[str, Any]:
         if not config_file.exists():
             raise ConfigError(f"Configuration file not found: {config_file}")
 
-        with open(config_file, 'r') as f:
-            config = yaml.safe_load(f)
+        cache_file = _cache_path(config_file)
+        try:
+            if cache_file.stat().st_mtime >= config_file.stat().st_mtime:
+                config = json.loads(cache_file.read_bytes())
+                logger.info(f"Loaded cached configuration from {cache_file}")
+                return config
+        except (OSError, ValueError):
+            # Missing or corrupt cache - fall back to parsing YAML
+            pass
+
+        with open(config_file, 'rb') as f:
+            config = _YAML_LOAD(f)
 
         if config is None:
             raise ConfigError(f"Configuration file is empty: {config_file}")
 
+        try:
+            cache_text = json.dumps(config)
+            # JSON stringifies non-str keys; only cache configs that round-trip
+            if json.loads(cache_text) == config:
+                cache_file.write_text(cache_text)
+            else:
+                logger.debug("Configuration not JSON round-trippable, skipping cache %s", cache_file)
+        except (OSError, TypeError, ValueError) as e:
+            # Read-only filesystem or non-JSON values - just skip caching
+            logger.debug("Could not write configuration cache %s: %s", cache_file, e)
+
         logger.info(f"Loaded configuration from {config_file}")
         return config
 
@@ -2,10 +2,10 @@
 
 import importlib
 import argparse
+import functools
 import sys
 from pathlib import Path
 
-from src.robot.quadruped import Quadruped
 from src.config.config_loader import load_config, get_config_path
 from src.utils.logger import setup_logger, get_logger
 from src.utils.exceptions import ConfigError, ControllerError, ServoError
@@ -16,6 +16,27 @@ log_dir.mkdir(exist_ok=True)
 logger = setup_logger('quadruped', log_file=log_dir / 'quadruped.log')
 
 
+@functools.lru_cache(maxsize=None)
+def _resolve_controller(controller_file: str):
+    """
+    Import a controller module and return its controller function (cached).
+
+    Args:
+        controller_file: Module path to controller
+
+    Returns:
+        Controller function
+
+    Raises:
+        ImportError: If controller module cannot be imported
+        ControllerError: If module has no 'controller' function
+    """
+    controller_lib = importlib.import_module(controller_file)
+    if not hasattr(controller_lib, 'controller'):
+        raise ControllerError(f"Controller module {controller_file} has no 'controller' function")
+    return controller_lib.controller
+
+
 def get_controller(controller_file: str):
     """
     Dynamically load a controller module.
@@ -31,10 +52,7 @@ def get_controller(controller_file: str):
     """
     try:
         logger.info(f"Loading controller: {controller_file}")
-        controller_lib = importlib.import_module(controller_file)
-        if not hasattr(controller_lib, 'controller'):
-            raise ControllerError(f"Controller module {controller_file} has no 'controller' function")
-        return controller_lib.controller
+        return _resolve_controller(sys.intern(controller_file))
     except ImportError as e:
         logger.error(f"Failed to import controller {controller_file}: {e}")
         raise ControllerError(f"Controller {controller_file} not found") from e
@@ -85,7 +103,8 @@ def main():
         # Load controller
         controller = get_controller(args.controller)
 
-        # Initialize robot
+        # Initialize robot (imported here so --help skips hardware/gait deps)
+        from src.robot.quadruped import Quadruped
         logger.info("Initializing quadruped robot")
         robot = Quadruped(config)
 
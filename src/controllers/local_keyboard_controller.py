@@ -1,47 +1,125 @@
 # Note that this library requires sudo privileges
 
+import functools
 import keyboard
+import numpy as np
+from src.controllers.utils.throttle import PollThrottle
 from src.utils.logger import get_logger
 from src.utils.exceptions import ValidationError
-from src.utils.validators import validate_positive_number
+from src.utils.validators import MAX_MOMENTUM, validate_positive_number
+from src.utils.jit import njit
 
 logger = get_logger(__name__)
 
+# Resolve key scan codes once so is_pressed() skips parsing key names.
+# Falls back to key names when the keymap is unavailable (e.g. headless).
+try:
+    _SCAN = {k: keyboard.key_to_scan_codes(k)[0] for k in ('w', 's', 'a', 'd')}
+except Exception as e:
+    logger.debug("Scan code lookup unavailable, using key names: %s", e)
+    _SCAN = {k: k for k in ('w', 's', 'a', 'd')}
 
-def controller(momentum, accel=0.01, bound=4):
+# Key bits in the polled mask
+_W, _A, _S, _D = 1, 2, 4, 8
+
+# Net (x, y) direction for every key combination, indexed by key mask
+_DELTA = np.array([
+    [bool(mask & _W) - bool(mask & _S), bool(mask & _D) - bool(mask & _A)]
+    for mask in range(16)
+], dtype=np.float64)
+
+# Limits how often the keyboard is polled
+_throttle = PollThrottle()
+
+
+@njit(cache=True, fastmath=True)
+def _apply(momentum, mask, accel, bound):
     """
-    Update the momentum of the robot based on keyboard presses.
+    Apply a key mask to momentum in place.
+
+    Args:
+        momentum: Momentum array [x, z, y, quit], updated in place
+        mask: Pressed keys as a bitmask of _W, _A, _S and _D
+        accel: Momentum change per call for a pressed direction
+        bound: The max/min magnitude that the robot can walk at
+
+    Returns:
+        True if momentum changed, False otherwise
+    """
+    dx = _DELTA[mask, 0]
+    dy = _DELTA[mask, 1]
+    if dx == 0.0 and dy == 0.0:
+        return False
+    momentum[0] = max(-bound, min(bound, momentum[0] + accel * dx))
+    momentum[1] = max(-bound, min(bound, momentum[1] + accel * dy))
+    return True
+
+
+@functools.lru_cache(maxsize=8)
+def _validated_params(accel, bound):
+    """
+    Validate parameters and convert them to floats for the update kernel.
+
+    Cached per (accel, bound) pair, so validation and float conversion run
+    once per pair; invalid pairs raise and are never cached.
 
     Args:
-        momentum: The existing momentum parameter [x, z, y, quit]
         accel: How quickly the robot starts walking in a given direction
         bound: The max/min magnitude that the robot can walk at
 
     Returns:
-        Updated momentum array
+        Tuple of (accel, bound) as floats
 
     Raises:
         ValidationError: If parameters are invalid
     """
-    # Validate parameters
     validate_positive_number(accel, "accel", min_value=0.0001)
     if accel > 1:
         raise ValidationError(f"Invalid accel value: {accel}. Must be <= 1")
     validate_positive_number(bound, "bound")
+    if bound > MAX_MOMENTUM:
+        # Momentum beyond this is rejected by the movement loop
+        raise ValidationError(f"Invalid bound value: {bound}. Must be <= {MAX_MOMENTUM}")
+
+    return float(accel), float(bound)
+
 
+def controller(momentum, accel=0.01, bound=4, poll_hz=200):
+    """
+    Update the momentum of the robot based on keyboard presses.
+
+    Args:
+        momentum: The existing momentum parameter [x, z, y, quit]
+        accel: How quickly the robot starts walking in a given direction
+        bound: The max/min magnitude that the robot can walk at
+            (at most MAX_MOMENTUM)
+        poll_hz: Maximum polling rate in Hz (None or 0 disables throttling)
+
+    Returns:
+        Updated momentum array
+
+    Raises:
+        ValidationError: If parameters are invalid
+    """
+    # Validated float parameters (converted once per pair)
     try:
-        if keyboard.is_pressed('w'):
-            momentum[0] = min(momentum[0] + accel, bound)
-            logger.debug("Forward key pressed")
-        if keyboard.is_pressed('s'):
-            momentum[0] = max(momentum[0] - accel, -bound)
-            logger.debug("Backward key pressed")
-        if keyboard.is_pressed('a'):
-            momentum[1] = max(momentum[1] - accel, -bound)
-            logger.debug("Left key pressed")
-        if keyboard.is_pressed('d'):
-            momentum[1] = min(momentum[1] + accel, bound)
-            logger.debug("Right key pressed")
+        accel, bound = _validated_params(accel, bound)
+    except TypeError:
+        # Unhashable parameters cannot be cached; validate directly so they
+        # are reported as ValidationError
+        accel, bound = _validated_params.__wrapped__(accel, bound)
+
+    _throttle.wait(poll_hz)
+
+    try:
+        # Poll keys into one mask, update momentum in the compiled kernel
+        is_pressed = keyboard.is_pressed
+        mask = (
+            is_pressed(_SCAN['w']) * _W | is_pressed(_SCAN['a']) * _A |
+            is_pressed(_SCAN['s']) * _S | is_pressed(_SCAN['d']) * _D
+        )
+        if _apply(momentum, mask, accel, bound):
+            logger.debug("Keyboard momentum: %s", momentum[:2])
     except Exception as e:
         logger.error(f"Keyboard controller error: {e}", exc_info=True)
 
@@ -49,13 +127,11 @@ def controller(momentum, accel=0.01, bound=4):
 
 
 if __name__ == "__main__":
-    import numpy as np
-
-    momentum = np.asarray([0, 0, 1], dtype=np.float32)
+    momentum = np.asarray([0, 0, 1, 0], dtype=np.float32)
     logger.info("Starting keyboard controller test")
     try:
         while True:
             momentum = controller(momentum)
-            logger.debug(f"Current momentum: {momentum}")
+            logger.debug("Current momentum: %s", momentum)
     except KeyboardInterrupt:
         logger.info("Keyboard controller test stopped")
@@ -2,6 +2,7 @@ import numpy as np
 import socket
 
 from src.controllers.utils.ip_helper import create_socket_connection
+from src.controllers.utils.throttle import PollThrottle
 from src.utils.logger import get_logger
 from src.utils.exceptions import ControllerError, ValidationError
 from src.utils.validators import validate_momentum
@@ -9,14 +10,42 @@ from src.utils.validators import validate_momentum
 logger = get_logger(__name__)
 
 s = create_socket_connection()
+s.setblocking(False)  # Poll without arming a timeout on every call
 
+# Preallocated momentum [x, z, y, quit] (4 x little-endian float32, the wire
+# format); datagrams are received straight into its memory
+_PACKET_SIZE = 16
+_rx = np.empty(4, dtype='<f4')
+_mv = memoryview(_rx).cast('B')
 
-def controller(momentum):
+# Per-call non-blocking flag; the socket is non-blocking as well, so
+# platforms without MSG_DONTWAIT still never wait
+_RECV_FLAGS = getattr(socket, 'MSG_DONTWAIT', 0)
+
+# Limits how often the socket is polled
+_throttle = PollThrottle()
+
+
+def _recv16():
+    """
+    Receive one momentum datagram into the preallocated buffer without waiting.
+
+    Returns:
+        Tuple of (number of bytes received, sender address)
+
+    Raises:
+        BlockingIOError: If no datagram is pending
+    """
+    return s.recvfrom_into(_mv, _PACKET_SIZE, _RECV_FLAGS)
+
+
+def controller(momentum, poll_hz=200):
     """
     Network receiver controller that receives momentum commands via UDP.
 
     Args:
         momentum: Current momentum array [x, z, y, quit]
+        poll_hz: Maximum polling rate in Hz (None or 0 disables throttling)
 
     Returns:
         Updated momentum array from network or current momentum if no data
@@ -25,36 +54,29 @@ def controller(momentum):
         ControllerError: If network error persists
     """
     max_consecutive_errors = 10
-    
-    # Initialize error counter if not exists
-    if not hasattr(controller, '_error_count'):
-        controller._error_count = 0
 
-    try:
-        s.settimeout(0.00001)
-        data, addr = s.recvfrom(1024)
-        if data:
-            if len(data) < 16:  # 4 floats * 4 bytes
-                logger.warning(f"Received incomplete data from {addr}: {len(data)} bytes")
-                return momentum
+    _throttle.wait(poll_hz)
 
-            momentum_new = np.frombuffer(data, dtype=np.float32)
-            if len(momentum_new) < 4:
-                logger.warning(f"Invalid momentum array length: {len(momentum_new)}")
+    try:
+        nbytes, addr = _recv16()
+        if nbytes:
+            if nbytes < _PACKET_SIZE:  # 4 floats * 4 bytes
+                logger.warning(f"Received incomplete data from {addr}: {nbytes} bytes")
                 return momentum
 
-            momentum = momentum_new[:4]  # Ensure exactly 4 elements
-            
             # Validate momentum
             try:
-                validate_momentum(momentum)
+                validate_momentum(_rx)
             except ValidationError as e:
                 logger.warning(f"Invalid momentum received: {e}")
                 return momentum
-            
+
+            # Copy into the caller's momentum (ndarray or array.array) so the
+            # buffer is never aliased
+            momentum[0], momentum[1], momentum[2], momentum[3] = _rx.tolist()
             controller._error_count = 0  # Reset error count on success
-            logger.debug(f"Received momentum from {addr}: {momentum}")
-    except socket.timeout:
+            logger.debug("Received momentum from %s: %s", addr, momentum)
+    except (BlockingIOError, socket.timeout):
         # Normal situation - no new data
         controller._error_count = 0
     except socket.error as e:
@@ -77,16 +99,19 @@ def controller(momentum):
     return momentum
 
 
+controller._error_count = 0
+
+
 if __name__ == "__main__":
     # Test network commands by logging momentum changes
     momentum = np.asarray([0, 0, 1, 0], dtype=np.float32)
-    lm = momentum
+    lm = momentum.copy()
     logger.info("Starting network receiver test")
     try:
         while True:
             momentum = controller(momentum)
             if (lm != momentum).any():
                 logger.info(f"Momentum changed: {momentum}")
-                lm = momentum
+                lm = momentum.copy()
     except KeyboardInterrupt:
         logger.info("Network receiver test stopped")
@@ -1,4 +1,5 @@
 import socket
+import time
 import numpy as np
 import argparse
 import keyboard
@@ -6,12 +7,39 @@ import keyboard
 from src.controllers.utils.ip_helper import create_socket_connection
 from src.utils.logger import get_logger
 from src.utils.exceptions import ControllerError, ValidationError
-from src.utils.validators import validate_positive_number
+from src.utils.validators import MAX_MOMENTUM, validate_positive_number
 
 logger = get_logger(__name__)
 
+# Resolve key scan codes once for the keyboard hooks.
+# Falls back to key names when the keymap is unavailable (e.g. headless).
+try:
+    _SCAN = {k: keyboard.key_to_scan_codes(k)[0] for k in ('w', 's', 'a', 'd', 'p')}
+except Exception as e:
+    logger.debug("Scan code lookup unavailable, using key names: %s", e)
+    _SCAN = {k: k for k in ('w', 's', 'a', 'd', 'p')}
 
-def controller(pi_ip, pi_port, accel=0.002, bound=4, return_to_zero=False):
+# Key states maintained by keyboard event hooks
+_pressed = {k: False for k in _SCAN}
+
+
+def _hook_keys():
+    """
+    Register press/release hooks that keep _pressed up to date.
+
+    Returns:
+        List of hook handles to pass to keyboard.unhook()
+    """
+    hooks = []
+    for key, scan_code in _SCAN.items():
+        hooks.append(keyboard.on_press_key(
+            scan_code, lambda e, k=key: _pressed.__setitem__(k, True)))
+        hooks.append(keyboard.on_release_key(
+            scan_code, lambda e, k=key: _pressed.__setitem__(k, False)))
+    return hooks
+
+
+def controller(pi_ip, pi_port, accel=0.002, bound=4, return_to_zero=False, poll_hz=200):
     """
     Network sender controller that sends keyboard commands via UDP.
 
@@ -19,8 +47,9 @@ def controller(pi_ip, pi_port, accel=0.002, bound=4, return_to_zero=False):
         pi_ip: Raspberry Pi IP address
         pi_port: Raspberry Pi port
         accel: Acceleration value (how quickly robot starts walking)
-        bound: Maximum/minimum magnitude for movement
+        bound: Maximum/minimum magnitude for movement (at most MAX_MOMENTUM)
         return_to_zero: If True, slowly return to zero when not controlling
+        poll_hz: Rate in Hz at which key states are sampled and sent
 
     Raises:
         ValidationError: If parameters are invalid
@@ -31,31 +60,42 @@ def controller(pi_ip, pi_port, accel=0.002, bound=4, return_to_zero=False):
     if accel > 1:
         raise ValidationError(f"Invalid accel value: {accel}. Must be <= 1")
     validate_positive_number(bound, "bound")
+    if bound > MAX_MOMENTUM:
+        # Momentum beyond this is rejected by the movement loop
+        raise ValidationError(f"Invalid bound value: {bound}. Must be <= {MAX_MOMENTUM}")
+    validate_positive_number(poll_hz, "poll_hz", min_value=1)
 
     try:
         s = create_socket_connection()
         server = (pi_ip, pi_port)
-        momentum = np.array([0., 0., 1., 0.])  # Control [x,z,y,quit] telemetry
+        # Control [x,z,y,quit] telemetry, aliased onto the send buffer so
+        # in-place updates need no per-packet serialization (4 x float32)
+        buf = bytearray(16)
+        momentum = np.frombuffer(buf, dtype='<f4')
+        momentum[2] = 1.0
         close = False
 
+        poll_interval = 1.0 / poll_hz
+        hooks = _hook_keys()
+
         logger.info(f"Network sender controller started. Target: {server}")
 
         while not close:
-            moved = False
+            time.sleep(poll_interval)
             try:
-                if keyboard.is_pressed('w'):
-                    momentum[0] = min(momentum[0] + accel, bound)
-                    moved = True
-                if keyboard.is_pressed('s'):
-                    momentum[0] = max(momentum[0] - accel, -bound)
-                    moved = True
-                if keyboard.is_pressed('a'):
-                    momentum[1] = max(momentum[1] - accel, -bound)
-                    moved = True
-                if keyboard.is_pressed('d'):
-                    momentum[1] = min(momentum[1] + accel, bound)
-                    moved = True
-                if keyboard.is_pressed('p'):
+                forward = _pressed['w']
+                backward = _pressed['s']
+                left = _pressed['a']
+                right = _pressed['d']
+                moved = forward or backward or left or right
+                # Scalar clamps: cheaper than a ufunc call on two lanes
+                if forward != backward:
+                    x = momentum[0] + (accel if forward else -accel)
+                    momentum[0] = bound if x > bound else (-bound if x < -bound else x)
+                if right != left:
+                    y = momentum[1] + (accel if right else -accel)
+                    momentum[1] = bound if y > bound else (-bound if y < -bound else y)
+                if _pressed['p']:
                     momentum[3] = 1
                     close = True
                     moved = True
@@ -74,8 +114,8 @@ def controller(pi_ip, pi_port, accel=0.002, bound=4, return_to_zero=False):
                         momentum[1] = momentum[1] + accel
 
                 if moved:
-                    s.sendto(momentum.tobytes(), server)
-                    logger.debug(f"Sent momentum: {momentum}")
+                    s.sendto(buf, server)
+                    logger.debug("Sent momentum: %s", momentum)
 
             except keyboard.KeyboardInterrupt:
                 logger.info("Interrupted by user")
@@ -83,6 +123,8 @@ def controller(pi_ip, pi_port, accel=0.002, bound=4, return_to_zero=False):
             except Exception as e:
                 logger.error(f"Error in controller loop: {e}", exc_info=True)
 
+        for hook in hooks:
+            keyboard.unhook(hook)
         s.close()
         logger.info("Network sender controller stopped")
 
@@ -98,7 +140,8 @@ if __name__ == '__main__':
     parser.add_argument('--accel', type=float, default=0.002)
     parser.add_argument('--bound', type=int, default=4)
     parser.add_argument('--return_to_zero', action='store_true')
+    parser.add_argument('--poll_hz', type=float, default=200)
     args = parser.parse_args()
 
     controller(args.pi_ip, args.pi_port, args.accel,
-               args.bound, args.return_to_zero)
+               args.bound, args.return_to_zero, args.poll_hz)
@@ -104,7 +104,7 @@ def main(_argv):
 
     server = (FLAGS.pi_ip, FLAGS.pi_port)
     print(server)
-    momentum = np.array([0., 0., 1., 0.])  # Control [x,z,y,quit] telemetry
+    momentum = np.array([0., 0., 1., 0.], dtype=np.float32)  # Control [x,z,y,quit] telemetry
     close = False
     # while program is running
     while not close:
@@ -1,5 +1,7 @@
 """Network utilities for socket connections."""
 
+import errno
+import functools
 import socket
 from src.utils.logger import get_logger
 from src.utils.exceptions import ConfigError
@@ -7,9 +9,10 @@ from src.utils.exceptions import ConfigError
 logger = get_logger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
 def get_ip() -> str:
     """
-    Get the local IP address of this machine.
+    Get the local IP address of this machine (cached after first lookup).
 
     Returns:
         IP address as string, defaults to '127.0.0.1' if detection fails
@@ -20,7 +23,7 @@ def get_ip() -> str:
         # Doesn't even have to be reachable
         s.connect(('10.255.255.255', 1))
         ip = s.getsockname()[0]
-        logger.debug(f"Detected local IP: {ip}")
+        logger.debug("Detected local IP: %s", ip)
     except Exception as e:
         logger.warning(f"Failed to detect IP address: {e}, using localhost")
         ip = '127.0.0.1'
@@ -42,20 +45,23 @@ def create_socket_connection(start_port: int = 5000, max_port: int = 9999):
 
     Raises:
         ConfigError: If no available port is found
+        OSError: If binding fails for a reason other than the port being in use
     """
     host = get_ip()
-    port = start_port
     s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
     max_attempts = min(start_port + 1000, max_port)
 
-    while port < max_attempts:
+    # Probe every 5th port (5000, 5005, ...) and only skip ports in use
+    for port in range(start_port, max_attempts, 5):
         try:
             s.bind((host, port))
             logger.info(f"Socket bound - IP: {host}, Port: {port}")
             return s
         except OSError as e:
-            logger.debug(f"Port {port} unavailable, trying next")
-            port += 1
+            if e.errno != errno.EADDRINUSE:
+                s.close()
+                raise
+            logger.debug("Port %d unavailable, trying next", port)
 
     s.close()
     raise ConfigError(
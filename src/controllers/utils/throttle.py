@@ -0,0 +1,31 @@
+"""Polling rate limiter shared by the input controllers."""
+
+import time
+
+
+class PollThrottle:
+    """
+    Limits how often a controller polls its input source.
+
+    Keeps the control loop from spinning on the keyboard or socket when
+    no new input can arrive.
+    """
+
+    __slots__ = ('_last_call',)
+
+    def __init__(self):
+        """Initialize throttle so the first call does not wait."""
+        self._last_call = 0.0
+
+    def wait(self, poll_hz) -> None:
+        """
+        Sleep until at least 1 / poll_hz seconds have passed since the last call.
+
+        Args:
+            poll_hz: Maximum polling rate in Hz (None or 0 disables throttling)
+        """
+        if not poll_hz:
+            return
+        elapsed = time.monotonic() - self._last_call
+        time.sleep(max(0.0, 1.0 / poll_hz - elapsed))
+        self._last_call = time.monotonic()
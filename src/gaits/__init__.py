@@ -1,7 +1,14 @@
 """Gait generation and trajectory planning."""
 
-from src.gaits.trajectory_generator import TrajectoryGenerator
-from src.gaits.gait_controller import GaitController
-
 __all__ = ['TrajectoryGenerator', 'GaitController']
 
+
+def __getattr__(name):
+    """Import gait components lazily on first access."""
+    if name == 'TrajectoryGenerator':
+        from src.gaits.trajectory_generator import TrajectoryGenerator
+        return TrajectoryGenerator
+    if name == 'GaitController':
+        from src.gaits.gait_controller import GaitController
+        return GaitController
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
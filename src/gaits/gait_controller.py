@@ -34,6 +34,47 @@ class GaitController:
         self.servo_controller = servo_controller
         self.kinematics = kinematics
         self.step_resolution = step_resolution
+        self._index_pairs: Optional[np.ndarray] = None
+
+        # Per-side IK solvers indexed by the `right` flag (False=0, True=1)
+        self._side_solvers = (kinematics.calculate_left, kinematics.calculate_right)
+
+        # Motor IDs written each trot step, and the matching positions in the
+        # flattened (joint, leg) batch IK result; legs are ordered FR, BR, FL, BL
+        # and joints shoulder, elbow, hip (back legs have no hip motor)
+        self._trot_motor_ids = np.array([
+            Motor.FR_SHOULDER, Motor.FR_ELBOW, Motor.FR_HIP,
+            Motor.BR_SHOULDER, Motor.BR_ELBOW,
+            Motor.FL_SHOULDER, Motor.FL_ELBOW, Motor.FL_HIP,
+            Motor.BL_SHOULDER, Motor.BL_ELBOW,
+        ], dtype=np.intp)
+        self._trot_angle_index = np.array([0, 4, 8, 1, 5, 2, 6, 10, 3, 7], dtype=np.intp)
+
+        # Per-step buffers reused by every trot step (legs FR, BR, FL, BL)
+        self._leg_x = np.empty(4, dtype=np.float64)
+        self._leg_y = np.empty(4, dtype=np.float64)
+        self._leg_z = np.empty(4, dtype=np.float64)
+        self._leg_right = np.array([True, True, False, False])
+        self._angles_buf = np.empty((3, 4), dtype=np.float64)
+        self._write_buf = np.empty(len(self._trot_motor_ids), dtype=np.float64)
+
+    def _get_index_pairs(self, trajectory_length: int) -> np.ndarray:
+        """
+        Get trajectory index pairs for the diagonal leg pairs (cached).
+
+        Args:
+            trajectory_length: Length of trajectory
+
+        Returns:
+            Integer array with shape (trajectory_length, 2) where row i holds
+            the indices used by both diagonal pairs at step i
+        """
+        if self._index_pairs is None or len(self._index_pairs) != trajectory_length:
+            steps = np.arange(trajectory_length)
+            self._index_pairs = np.stack(
+                (steps, (steps + self.step_resolution) % trajectory_length), axis=1
+            )
+        return self._index_pairs
 
     def apply_trajectory_to_leg(
         self,
@@ -57,9 +98,7 @@ class GaitController:
             hip_motor: Optional motor ID for hip
             right: True for right side, False for left
         """
-        shoulder_angle, elbow_angle, hip_angle = self.kinematics.calculate(
-            x, y, z, right=right
-        )
+        shoulder_angle, elbow_angle, hip_angle = self._side_solvers[bool(right)](x, y, z)
 
         # Set shoulder and elbow angles
         self.servo_controller.set_angle(shoulder_motor, shoulder_angle)
@@ -83,42 +122,20 @@ class GaitController:
             step_index: Current step index
             trajectory_length: Length of trajectory
         """
-        x_coords, z_coords, y_coords = trajectory
-
-        # Calculate indices for diagonal leg pairs
-        index_1 = step_index % trajectory_length
-        index_2 = (step_index + self.step_resolution) % trajectory_length
-
-        # Pre-calculate coordinate values
-        x1, y1, z1 = x_coords[index_1], y_coords[index_1], z_coords[index_1]
-        x2, y2, z2 = x_coords[index_2], y_coords[index_2], z_coords[index_2]
-
-        # Apply movement to legs (trot gait - diagonal pairs)
-        # Front Right leg
-        self.apply_trajectory_to_leg(
-            Motor.FR_SHOULDER, Motor.FR_ELBOW,
-            x1, y1 - 1, z=z1,
-            hip_motor=Motor.FR_HIP, right=True
-        )
-
-        # Back Right leg
-        self.apply_trajectory_to_leg(
-            Motor.BR_SHOULDER, Motor.BR_ELBOW,
-            x2, y2 + 2,
-            right=True
+        # Gather coordinates for both diagonal leg pairs in one fetch
+        indices = self._get_index_pairs(trajectory_length)[step_index % trajectory_length]
+        (x1, x2), (z1, z2), (y1, y2) = trajectory[:, indices].tolist()
+
+        # Solve all legs in one batch (trot gait - diagonal pairs)
+        # Order: Front Right, Back Right, Front Left, Back Left
+        self._leg_x[:] = (x1, x2, x2, x1)
+        self._leg_y[:] = (y1 - 1, y2 + 2, y2 - 1, y1 + 2)
+        self._leg_z[:] = (z1, 0.0, -z2, 0.0)
+        self.kinematics.calculate_into(
+            self._angles_buf, self._leg_x, self._leg_y, self._leg_z, self._leg_right
         )
 
-        # Front Left leg
-        self.apply_trajectory_to_leg(
-            Motor.FL_SHOULDER, Motor.FL_ELBOW,
-            x2, y2 - 1, z=-z2,
-            hip_motor=Motor.FL_HIP, right=False
-        )
-
-        # Back Left leg
-        self.apply_trajectory_to_leg(
-            Motor.BL_SHOULDER, Motor.BL_ELBOW,
-            x1, y1 + 2,
-            right=False
-        )
+        # Write all 10 motors in one validated batch
+        np.take(self._angles_buf, self._trot_angle_index, out=self._write_buf)
+        self.servo_controller.set_angles(self._trot_motor_ids, self._write_buf)
 
@@ -1,13 +1,59 @@
 """Trajectory generation using Bezier curves."""
 
-import bezier
 import numpy as np
-from typing import Tuple
+from typing import Dict, Tuple
 
 from src.utils.logger import get_logger
+from src.utils.jit import njit
 
 logger = get_logger(__name__)
 
+# Control points (rows: x, z, y) of the cubic step curve (lifting foot)
+_STEP_NODES = np.array([
+    [-1.0, -1.0, 1.0, 1.0],
+    [-1.0, -1.0, 1.0, 1.0],
+    [-15.0, -10.0, -10.0, -15.0],
+])
+
+# End points (rows: x, z, y) of the linear slide curve (sliding foot)
+_SLIDE_NODES = np.array([
+    [1.0, -1.0],
+    [1.0, -1.0],
+    [-15.0, -15.0],
+])
+
+
+@njit(cache=True)
+def _build_trajectory(step_nodes: np.ndarray, slide_nodes: np.ndarray, n: int) -> np.ndarray:
+    """
+    Sample the step and slide Bezier curves into one gait cycle.
+
+    Args:
+        step_nodes: (3, 4) control points of the cubic step curve
+        slide_nodes: (3, 2) end points of the linear slide curve
+        n: Number of samples per curve
+
+    Returns:
+        Float32 array with shape (3, 2 * n): n step samples followed by
+        n slide samples
+    """
+    out = np.empty((3, 2 * n), np.float32)
+    for i in range(n):
+        s = i / (n - 1) if n > 1 else 0.0
+        t = 1.0 - s
+        # Cubic Bernstein basis
+        b0 = t * t * t
+        b1 = 3.0 * t * t * s
+        b2 = 3.0 * t * s * s
+        b3 = s * s * s
+        for row in range(3):
+            out[row, i] = (
+                b0 * step_nodes[row, 0] + b1 * step_nodes[row, 1] +
+                b2 * step_nodes[row, 2] + b3 * step_nodes[row, 3]
+            )
+            out[row, n + i] = t * slide_nodes[row, 0] + s * slide_nodes[row, 1]
+    return out
+
 
 class TrajectoryGenerator:
     """
@@ -24,51 +70,29 @@ class TrajectoryGenerator:
             step_resolution: Number of points in step trajectory
         """
         self.step_resolution = step_resolution
-        self._cached_trajectory = None
-        self._cached_length = None
+        self._cache: Dict[Tuple[int], Tuple[np.ndarray, int]] = {}
 
     def generate(self) -> Tuple[np.ndarray, int]:
         """
-        Generate gait trajectory using Bezier curves (cached).
+        Generate gait trajectory using Bezier curves (cached per parameters).
 
         Returns:
             Tuple of (motion_trajectory, trajectory_length)
         """
-        if self._cached_trajectory is not None:
-            return self._cached_trajectory, self._cached_length
-
-        s_vals = np.linspace(0.0, 1.0, self.step_resolution)
-
-        # Step trajectory (lifting foot)
-        step_nodes = np.asfortranarray([
-            [-1.0, -1.0, 1.0, 1.0],
-            [-1.0, -1.0, 1.0, 1.0],
-            [-15.0, -10, -10, -15.0],
-        ])
-        step_curve = bezier.Curve(step_nodes, degree=3)
-        step_trajectory = step_curve.evaluate_multi(s_vals)
-
-        # Slide trajectory (sliding foot)
-        slide_nodes = np.asfortranarray([
-            [1.0, -1.0],
-            [1.0, -1.0],
-            [-15.0, -15],
-        ])
-        slide_curve = bezier.Curve(slide_nodes, degree=1)
-        slide_trajectory = slide_curve.evaluate_multi(s_vals)
-
-        # Combined motion trajectory
-        motion_trajectory = np.concatenate((step_trajectory, slide_trajectory), axis=1)
-        trajectory_length = len(motion_trajectory[0])
-
-        self._cached_trajectory = motion_trajectory
-        self._cached_length = trajectory_length
-
-        logger.debug(f"Generated trajectory with {trajectory_length} points")
+        key = (self.step_resolution,)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        # Step samples (lifting foot) followed by slide samples (sliding foot)
+        motion_trajectory = _build_trajectory(_STEP_NODES, _SLIDE_NODES, self.step_resolution)
+        trajectory_length = motion_trajectory.shape[1]
+
+        self._cache[key] = (motion_trajectory, trajectory_length)
+
+        logger.debug("Generated trajectory with %d points", trajectory_length)
         return motion_trajectory, trajectory_length
 
     def clear_cache(self) -> None:
-        """Clear cached trajectory."""
-        self._cached_trajectory = None
-        self._cached_length = None
-
+        """Clear cached trajectories."""
+        self._cache.clear()
@@ -1,6 +1,11 @@
 """Hardware abstraction layer for servo control."""
 
-from src.hardware.servo_controller import ServoController, Motor
-
 __all__ = ['ServoController', 'Motor']
 
+
+def __getattr__(name):
+    """Import hardware components lazily on first access."""
+    if name in __all__:
+        from src.hardware import servo_controller
+        return getattr(servo_controller, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,5 +1,7 @@
 """Servo motor controller abstraction."""
 
+import time
+import numpy as np
 from enum import IntEnum
 from typing import Dict, Any, Optional
 from adafruit_servokit import ServoKit
@@ -98,23 +100,73 @@ class ServoController:
         validate_motor_id(motor_id)
         validate_angle(degrees)
 
+        return self._write_angle(motor_id, degrees, retry_count)
+
+    def set_angles(self, ids: np.ndarray, degrees: np.ndarray, retry_count: int = 3) -> bool:
+        """
+        Set the angles of several motors, validating the whole batch up front.
+
+        Args:
+            ids: Integer array of motor IDs (0-9)
+            degrees: Array of angles in degrees (0-180), one per motor ID
+            retry_count: Number of retry attempts per motor on failure (default: 3)
+
+        Returns:
+            True if all motors were set
+
+        Raises:
+            ValidationError: If any motor ID or angle is invalid
+            ServoError: If a servo operation fails after retries
+        """
+        ids = np.asarray(ids)
+        degrees = np.asarray(degrees, dtype=np.float64)
+
+        # Validate the batch once, before any motor is moved
+        if ids.shape != degrees.shape:
+            raise ValidationError(
+                f"Invalid set_angles input: ids shape {ids.shape} != degrees shape {degrees.shape}"
+            )
+        if ids.dtype.kind not in 'iu' or ((ids < 0) | (ids >= 10)).any():
+            raise ValidationError(f"Invalid motor_id in {ids}. Must be integers in [0, 9]")
+        # Written as a negated in-range test so NaN is rejected as well
+        if not ((degrees >= 0.0) & (degrees <= 180.0)).all():
+            raise ValidationError(f"Angles {degrees} out of range [0.0, 180.0]")
+
+        for motor_id, angle in zip(ids.tolist(), degrees.tolist()):
+            self._write_angle(motor_id, angle, retry_count)
+        return True
+
+    def _write_angle(self, motor_id: int, degrees: float, retry_count: int) -> bool:
+        """
+        Write an already validated angle to a motor with retry logic.
+
+        Args:
+            motor_id: The motor ID (0-9)
+            degrees: The angle in degrees (0-180)
+            retry_count: Number of retry attempts on failure
+
+        Returns:
+            True if successful
+
+        Raises:
+            ServoError: If servo operation fails after retries
+        """
         # Retry logic for graceful degradation
         last_error = None
         for attempt in range(retry_count):
             try:
-                import time
-                start_time = time.time()
+                start_time = time.perf_counter()
                 self.kit.servo[motor_id].angle = degrees
-                duration = time.time() - start_time
+                duration = time.perf_counter() - start_time
 
                 # Record metrics if available
                 if self.metrics:
                     self.metrics.record_motor_angle(motor_id, degrees)
-                    self.metrics.record_performance('set_angle', duration)
+                    self.metrics.record_performance('set_angle', duration, start_time)
 
                 if attempt > 0:
                     logger.warning(f"Motor {motor_id} succeeded on retry {attempt + 1}")
-                logger.debug(f"Set motor {motor_id} to {degrees} degrees")
+                logger.debug("Set motor %d to %s degrees", motor_id, degrees)
                 return True
             except Exception as e:
                 last_error = e
@@ -136,29 +188,26 @@ class ServoController:
 
     def calibrate(self, calibration_angles: Dict[int, float]) -> bool:
         """
-        Calibrate all servos to specified angles.
+        Calibrate all servos to specified angles in one validated batch.
 
         Args:
             calibration_angles: Dictionary mapping motor_id to calibration angle
 
         Returns:
-            True if calibration successful, False otherwise
+            True if calibration successful, False otherwise (no motor is
+            moved when any motor ID or angle is invalid)
         """
         logger.info("Starting servo calibration")
-        success = True
-
-        for motor_id, angle in calibration_angles.items():
-            try:
-                self.set_angle(motor_id, angle)
-                logger.debug(f"Calibrated motor {motor_id} to {angle} degrees")
-            except Exception as e:
-                logger.error(f"Failed to calibrate motor {motor_id}: {e}")
-                success = False
 
-        if success:
-            logger.info("Servo calibration completed successfully")
-        else:
-            logger.warning("Servo calibration completed with errors")
+        try:
+            self.set_angles(
+                np.array(list(calibration_angles.keys()), dtype=np.intp),
+                np.array(list(calibration_angles.values()), dtype=np.float64)
+            )
+        except Exception as e:
+            logger.error(f"Servo calibration failed: {e}")
+            return False
 
-        return success
+        logger.info("Servo calibration completed successfully")
+        return True
 
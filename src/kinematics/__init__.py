@@ -1,6 +1,11 @@
 """Inverse kinematics calculations for quadruped robot."""
 
-from src.kinematics.inverse_kinematics import InverseKinematics
-
 __all__ = ['InverseKinematics']
 
+
+def __getattr__(name):
+    """Import kinematics components lazily on first access."""
+    if name == 'InverseKinematics':
+        from src.kinematics.inverse_kinematics import InverseKinematics
+        return InverseKinematics
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
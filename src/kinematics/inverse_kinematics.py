@@ -1,15 +1,132 @@
 """Inverse kinematics calculations for quadruped legs."""
 
 import math
+from functools import partial
+
 import numpy as np
 from typing import Tuple, Optional
 
 from src.utils.logger import get_logger
 from src.utils.exceptions import KinematicsError, ValidationError
-from src.utils.validators import validate_coordinate
+from src.utils.validators import validate_xyz
+from src.utils.jit import njit
 
 logger = get_logger(__name__)
 
+# Math functions bound at module level: a plain global lookup in the
+# interpreted kernel instead of global + attribute lookup per call
+_sqrt = math.sqrt
+_hypot = math.hypot
+_acos = math.acos
+_atan2 = math.atan2
+
+# Radians to degrees factor, a compile-time constant inside the kernel
+_RAD2DEG = 180.0 / math.pi
+
+# Kernel status codes
+_IK_OK = 0
+_IK_UNREACHABLE = 1
+
+
+@njit(cache=True, fastmath=True)
+def _ik_kernel(
+    x: float,
+    y: float,
+    z: float,
+    u2: float,
+    l2: float,
+    u2_plus_l2: float,
+    two_ul: float,
+    two_u: float,
+    min_reach2: float,
+    max_reach2: float
+) -> Tuple[float, float, float, int]:
+    """
+    Solve leg IK for one position without offsets or validation.
+
+    Args:
+        x: X coordinate (forward/backward) in cm
+        y: Y coordinate (up/down) in cm
+        z: Z coordinate (left/right) in cm, already mirrored for the side
+        u2: Squared upper leg length
+        l2: Squared lower leg length
+        u2_plus_l2: u2 + l2
+        two_ul: 2 * upper * lower leg length
+        two_u: 2 * upper leg length
+        min_reach2: Squared minimum reach
+        max_reach2: Squared maximum reach
+
+    Returns:
+        Tuple of (shoulder, elbow, hip) in degrees and a status code
+        (_IK_OK or _IK_UNREACHABLE)
+    """
+    distance_xyz2 = x * x + y * y + z * z
+
+    # Check both reach bounds on squared distance before taking any sqrt
+    if distance_xyz2 > max_reach2 or distance_xyz2 < min_reach2:
+        return 0.0, 0.0, 0.0, _IK_UNREACHABLE
+    distance_xy = _hypot(x, y)
+    distance_xyz = _sqrt(distance_xyz2)
+
+    # Law of cosines, clamped to the valid acos domain
+    cos_elbow = max(-1.0, min(1.0, (u2_plus_l2 - distance_xyz2) / two_ul))
+    cos_shoulder = max(-1.0, min(1.0, (u2 + distance_xyz2 - l2) / (two_u * distance_xyz)))
+
+    shoulder = _acos(cos_shoulder) * _RAD2DEG
+    elbow = _acos(cos_elbow) * _RAD2DEG
+    hip = _atan2(z, distance_xy) * _RAD2DEG
+    return shoulder, elbow, hip, _IK_OK
+
+
+@njit(cache=True, fastmath=True)
+def _ik_into_kernel(
+    out: np.ndarray,
+    x: np.ndarray,
+    y: np.ndarray,
+    z: np.ndarray,
+    right: np.ndarray,
+    offsets: np.ndarray,
+    u2: float,
+    l2: float,
+    u2_plus_l2: float,
+    two_ul: float,
+    two_u: float,
+    min_reach2: float,
+    max_reach2: float
+) -> int:
+    """
+    Solve leg IK for several positions into a preallocated array.
+
+    Args:
+        out: (3, N) output array for (shoulder, elbow, hip) in degrees
+        x: X coordinates (forward/backward) in cm
+        y: Y coordinates (up/down) in cm
+        z: Z coordinates (left/right) in cm
+        right: Boolean side flags, False mirrors z
+        offsets: (shoulder, elbow, hip) offsets added to the angles
+        u2: Squared upper leg length
+        l2: Squared lower leg length
+        u2_plus_l2: u2 + l2
+        two_ul: 2 * upper * lower leg length
+        two_u: 2 * upper leg length
+        min_reach2: Squared minimum reach
+        max_reach2: Squared maximum reach
+
+    Returns:
+        Index of the first unreachable position, or -1 if all were solved
+    """
+    for i in range(x.shape[0]):
+        zi = z[i] if right[i] else -z[i]
+        shoulder, elbow, hip, status = _ik_kernel(
+            x[i], y[i], zi, u2, l2, u2_plus_l2, two_ul, two_u, min_reach2, max_reach2
+        )
+        if status != _IK_OK:
+            return i
+        out[0, i] = shoulder + offsets[0]
+        out[1, i] = elbow + offsets[1]
+        out[2, i] = hip + offsets[2]
+    return -1
+
 
 class InverseKinematics:
     """
@@ -37,9 +154,32 @@ class InverseKinematics:
         self.hip_offset = offsets_config.get('hip', 0.0)
         self.hip_parameter = kinematics_config.get('hip_offset', 2.0)
 
+        # Geometry invariants reused by every IK call
+        self._u2 = self.upper_leg_length ** 2
+        self._l2 = self.lower_leg_length ** 2
+        self._u2_plus_l2 = self._u2 + self._l2
+        self._two_ul = 2.0 * self.upper_leg_length * self.lower_leg_length
+        self._two_u = 2.0 * self.upper_leg_length
+        # Reachable positions lie in the shell min_reach <= distance <= max_reach
+        self._min_reach = abs(self.upper_leg_length - self.lower_leg_length)
+        self._min_reach2 = self._min_reach ** 2
+        self._max_reach = self.upper_leg_length + self.lower_leg_length
+        self._max_reach2 = self._max_reach ** 2
+
+        # Joint offsets (shoulder, elbow, hip) for batch calculations
+        self._angle_offsets = np.array(
+            [self.shoulder_offset, self.elbow_offset, self.hip_offset],
+            dtype=np.float64
+        )
+
+        # Side-specialized solvers: legs are wired to a fixed side, so callers
+        # pick one once instead of branching on `right` every call
+        self.calculate_right = partial(self._calc_impl, sign=1.0)
+        self.calculate_left = partial(self._calc_impl, sign=-1.0)
+
         logger.debug(
-            f"InverseKinematics initialized: "
-            f"upper={self.upper_leg_length}, lower={self.lower_leg_length}"
+            "InverseKinematics initialized: upper=%s, lower=%s",
+            self.upper_leg_length, self.lower_leg_length
         )
 
     def calculate(
@@ -49,7 +189,7 @@ class InverseKinematics:
         z: float = 0.0,
         hip_offset: Optional[float] = None,
         right: bool = True
-    ) -> Tuple[float, float]:
+    ) -> Tuple[float, float, float]:
         """
         Calculate joint angles for desired end-effector position.
 
@@ -61,80 +201,122 @@ class InverseKinematics:
             right: True for right side, False for left side
 
         Returns:
-            Tuple of (shoulder_angle, elbow_angle) in degrees
+            Tuple of (shoulder_angle, elbow_angle, hip_angle) in degrees
 
         Raises:
             ValidationError: If coordinates are invalid
             KinematicsError: If position is unreachable
         """
         # Validate inputs
-        validate_coordinate(x, "x")
-        validate_coordinate(y, "y")
-        validate_coordinate(z, "z")
-        
+        validate_xyz(x, y, z)
+
         if y < 0.1:
             raise ValidationError(f"Y coordinate too small: {y}. Must be >= 0.1")
 
-        # Use provided hip_offset or default
-        hip_offset = hip_offset if hip_offset is not None else self.hip_parameter
-
-        # Adjust for left/right side
-        if not right:
-            z = -z
-
-        # Calculate distances
-        upper_link_length = self.upper_leg_length
-        lower_link_length = self.lower_leg_length
-
-        # Distance from hip to end-effector
-        distance_xy = math.sqrt(x * x + y * y)
-        distance_xyz = math.sqrt(distance_xy * distance_xy + z * z)
-
-        # Check reachability
-        max_reach = upper_link_length + lower_link_length
-        if distance_xyz > max_reach:
-            raise KinematicsError(
-                f"Position unreachable: distance={distance_xyz:.2f}cm, "
-                f"max_reach={max_reach:.2f}cm"
-            )
-
-        # Calculate angles using law of cosines
-        # Angle between upper and lower links
-        cos_elbow = (
-            (upper_link_length * upper_link_length +
-             lower_link_length * lower_link_length -
-             distance_xyz * distance_xyz) /
-            (2 * upper_link_length * lower_link_length)
+        shoulder_angle, elbow_angle, hip_angle = self._calc_impl(
+            x, y, z, sign=1.0 if right else -1.0
         )
 
-        # Clamp to valid range for acos
-        cos_elbow = max(-1.0, min(1.0, cos_elbow))
-        elbow_angle_rad = math.acos(cos_elbow)
+        logger.debug(
+            "Calculated angles: shoulder=%.2f°, elbow=%.2f°, hip=%.2f°",
+            shoulder_angle, elbow_angle, hip_angle
+        )
+
+        return shoulder_angle, elbow_angle, hip_angle
 
-        # Angle of upper link relative to horizontal
-        cos_shoulder = (
-            (upper_link_length * upper_link_length +
-             distance_xyz * distance_xyz -
-             lower_link_length * lower_link_length) /
-            (2 * upper_link_length * distance_xyz)
+    def _calc_impl(
+        self,
+        x: float,
+        y: float,
+        z: float,
+        sign: float
+    ) -> Tuple[float, float, float]:
+        """
+        Solve joint angles for one side without validation or logging.
+
+        Bound as calculate_right (sign=1.0) and calculate_left (sign=-1.0).
+
+        Args:
+            x: X coordinate (forward/backward) in cm
+            y: Y coordinate (up/down) in cm
+            z: Z coordinate (left/right) in cm
+            sign: 1.0 for right side, -1.0 for left side (mirrors z)
+
+        Returns:
+            Tuple of (shoulder_angle, elbow_angle, hip_angle) in degrees
+
+        Raises:
+            KinematicsError: If position is unreachable
+        """
+        z = z * sign
+
+        shoulder, elbow, hip, status = _ik_kernel(
+            float(x), float(y), float(z),
+            self._u2, self._l2, self._u2_plus_l2,
+            self._two_ul, self._two_u, self._min_reach2, self._max_reach2
+        )
+        if status == _IK_UNREACHABLE:
+            raise self._unreachable_error(_sqrt(x * x + y * y + z * z))
+
+        # Apply offsets
+        return (
+            shoulder + self.shoulder_offset,
+            elbow + self.elbow_offset,
+            hip + self.hip_offset
         )
-        cos_shoulder = max(-1.0, min(1.0, cos_shoulder))
-        shoulder_angle_rad = math.acos(cos_shoulder)
 
-        # Calculate hip angle
-        hip_angle_rad = math.atan2(z, distance_xy)
+    def calculate_into(
+        self,
+        out: np.ndarray,
+        x: np.ndarray,
+        y: np.ndarray,
+        z: np.ndarray,
+        right: np.ndarray
+    ) -> np.ndarray:
+        """
+        Calculate joint angles for several positions into a preallocated array.
+
+        Allocation-free batch counterpart of calculate() for the gait loop;
+        inputs are not type-checked and out is left partially written on error.
 
-        # Convert to degrees and apply offsets
-        shoulder_angle = math.degrees(shoulder_angle_rad) + self.shoulder_offset
-        elbow_angle = math.degrees(elbow_angle_rad) + self.elbow_offset
-        hip_angle = math.degrees(hip_angle_rad) + self.hip_offset
+        Args:
+            out: Float64 array with shape (3, N) receiving (shoulder, elbow, hip)
+                angles in degrees
+            x: Float64 array of N X coordinates (forward/backward) in cm
+            y: Float64 array of N Y coordinates (up/down) in cm
+            z: Float64 array of N Z coordinates (left/right) in cm
+            right: Boolean array of N side flags, True for right side
 
-        logger.debug(
-            f"Calculated angles: shoulder={shoulder_angle:.2f}°, "
-            f"elbow={elbow_angle:.2f}°, hip={hip_angle:.2f}°"
+        Returns:
+            The out array
+
+        Raises:
+            KinematicsError: If any position is unreachable
+        """
+        bad = _ik_into_kernel(
+            out, x, y, z, right, self._angle_offsets,
+            self._u2, self._l2, self._u2_plus_l2,
+            self._two_ul, self._two_u, self._min_reach2, self._max_reach2
         )
+        if bad >= 0:
+            xb, yb, zb = x[bad], y[bad], z[bad]
+            raise self._unreachable_error(_sqrt(xb * xb + yb * yb + zb * zb))
+        return out
 
-        return shoulder_angle, elbow_angle, hip_angle
+    def _unreachable_error(self, distance: float) -> KinematicsError:
+        """
+        Build the error raised for a position outside the reachable shell.
+
+        Args:
+            distance: Distance from hip to the requested position in cm
+
+        Returns:
+            KinematicsError describing the violated reach bounds
+        """
+        return KinematicsError(
+            f"Position unreachable: distance={distance:.2f}cm, "
+            f"reach={self._min_reach:.2f}..{self._max_reach:.2f}cm"
+        )
 
     @staticmethod
     def rad_to_degree(radians: float) -> float:
@@ -147,5 +329,5 @@ class InverseKinematics:
         Returns:
             Angle in degrees
         """
-        return math.degrees(radians)
+        return radians * _RAD2DEG
 
@@ -1,5 +1,7 @@
 """Main Quadruped robot controller using modular architecture."""
 
+import logging
+import os
 import time
 import numpy as np
 from typing import Optional, Dict, Any, Callable, List
@@ -8,12 +10,18 @@ from src.hardware.servo_controller import ServoController, Motor
 from src.kinematics.inverse_kinematics import InverseKinematics
 from src.gaits.trajectory_generator import TrajectoryGenerator
 from src.gaits.gait_controller import GaitController
+from src.utils.exceptions import ValidationError
 from src.utils.logger import get_logger
 from src.utils.monitoring import RobotMetrics
+from src.utils.validators import validate_tick, validate_xyz
 from src.utils.alerts import send_critical_alert
 
 logger = get_logger(__name__)
 
+# Full tracebacks for movement loop errors are opt-in (QUADRUPED_TRACEBACKS=1);
+# by default only the exception message is logged and the error is re-raised
+_LOG_TRACEBACKS = os.environ.get('QUADRUPED_TRACEBACKS', '0') not in ('', '0')
+
 
 class Quadruped:
     """
@@ -22,6 +30,14 @@ class Quadruped:
     Coordinates hardware control, kinematics, and gait generation.
     """
 
+    # Leg ID -> (shoulder motor, elbow motor, hip motor or None, right side)
+    _LEG_MAPPING = {
+        'FR': (Motor.FR_SHOULDER, Motor.FR_ELBOW, Motor.FR_HIP, True),
+        'FL': (Motor.FL_SHOULDER, Motor.FL_ELBOW, Motor.FL_HIP, False),
+        'BR': (Motor.BR_SHOULDER, Motor.BR_ELBOW, None, True),
+        'BL': (Motor.BL_SHOULDER, Motor.BL_ELBOW, None, False),
+    }
+
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
         Initialize the quadruped robot.
@@ -94,13 +110,12 @@ class Quadruped:
         calibration_dict = {}
         for motor_name, angle in self.calibration_angles.items():
             try:
-                motor_id = Motor[motor_name].value
-                calibration_dict[motor_id] = angle
+                calibration_dict[Motor[motor_name].value] = angle
             except KeyError:
                 logger.warning(f"Unknown motor name in calibration: {motor_name}")
 
-        success = self.servo_controller.calibrate(calibration_dict)
-        return success
+        # Servo controller writes all motors in one validated batch
+        return self.servo_controller.calibrate(calibration_dict)
 
     def leg_position(self, leg_id: str, x: float, y: float, z: float = 0.0) -> bool:
         """
@@ -118,24 +133,22 @@ class Quadruped:
         Raises:
             ValidationError: If leg_id is invalid
         """
-        from src.utils.validators import validate_leg_id, validate_coordinate
-
-        # Validate inputs
-        validate_leg_id(leg_id)
-        validate_coordinate(x, "x")
-        validate_coordinate(y, "y")
-        validate_coordinate(z, "z")
-
-        leg_mapping = {
-            'FR': (Motor.FR_SHOULDER, Motor.FR_ELBOW, Motor.FR_HIP, True),
-            'FL': (Motor.FL_SHOULDER, Motor.FL_ELBOW, Motor.FL_HIP, False),
-            'BR': (Motor.BR_SHOULDER, Motor.BR_ELBOW, None, True),
-            'BL': (Motor.BL_SHOULDER, Motor.BL_ELBOW, None, False),
-        }
+        # Validate inputs (leg_id with a single lookup in the leg mapping)
+        leg = self._LEG_MAPPING.get(leg_id) if isinstance(leg_id, str) else None
+        if leg is None:
+            raise ValidationError(
+                f"Invalid leg_id: {leg_id}. Must be one of {tuple(self._LEG_MAPPING)}"
+            )
+        validate_xyz(x, y, z)
 
-        shoulder_motor, elbow_motor, hip_motor, right = leg_mapping[leg_id]
+        shoulder_motor, elbow_motor, hip_motor, right = leg
 
         try:
+            # Same precondition as InverseKinematics.calculate(); the side
+            # solvers used below skip it
+            if y < 0.1:
+                raise ValidationError(f"Y coordinate too small: {y}. Must be >= 0.1")
+
             self.gait_controller.apply_trajectory_to_leg(
                 shoulder_motor, elbow_motor, x, y, z,
                 hip_motor=hip_motor, right=right
@@ -166,11 +179,17 @@ class Quadruped:
 
         # Generate trajectory once (cached)
         motion_trajectory, trajectory_length = self.trajectory_generator.generate()
-        logger.debug(f"Generated trajectory with {trajectory_length} points")
+        logger.debug("Generated trajectory with %d points", trajectory_length)
+
+        # Keep the per-cycle scaling in float32 end to end (momentum is float32)
+        motion_trajectory = motion_trajectory.astype(np.float32, copy=False)
+
+        # Scaled trajectory buffer, reused every cycle
+        self._trajectory_buf = np.empty((3, trajectory_length), dtype=np.float32)
 
         try:
             while True:
-                cycle_start = time.time()
+                cycle_start = time.perf_counter()
 
                 # Get momentum from controller
                 momentum = controller(momentum)
@@ -183,20 +202,17 @@ class Quadruped:
                     logger.info("Shutdown signal received")
                     break
 
-                # Apply momentum to trajectory
-                momentum_3d = momentum[:3, None]
-                x_coords = motion_trajectory[0] * momentum_3d[0]
-                z_coords = motion_trajectory[1] * momentum_3d[1]
-                y_coords = motion_trajectory[2] * momentum_3d[2]
+                validate_tick(momentum)
 
-                # Combine into trajectory array
-                trajectory = np.array([x_coords, z_coords, y_coords])
+                # Apply momentum to trajectory (x, z, y) in one in-place pass
+                trajectory = self._trajectory_buf
+                np.multiply(motion_trajectory, momentum[:3, None], out=trajectory)
 
-                # Record movement
-                self.metrics.record_movement(
-                    momentum.tolist(),
-                    trajectory=[x_coords.tolist(), z_coords.tolist(), y_coords.tolist()]
-                )
+                # Record movement (trajectory only when explicitly enabled)
+                if self.metrics.record_trajectories:
+                    self.metrics.record_movement(momentum, trajectory=trajectory)
+                else:
+                    self.metrics.record_movement(momentum)
 
                 # Apply trot gait step
                 self.gait_controller.apply_trot_gait_step(
@@ -207,15 +223,18 @@ class Quadruped:
                 cycle_count += 1
 
                 # Record performance
-                cycle_duration = time.time() - cycle_start
-                self.metrics.record_performance('movement_cycle', cycle_duration)
+                cycle_duration = time.perf_counter() - cycle_start
+                self.metrics.record_performance(
+                    'movement_cycle', cycle_duration, cycle_start
+                )
 
                 # Log metrics periodically
-                if cycle_count % 100 == 0:
+                if cycle_count % 100 == 0 and logger.isEnabledFor(logging.DEBUG):
                     perf_stats = self.metrics.get_performance_stats()
                     logger.debug(
-                        f"Cycle {cycle_count}: avg_duration={perf_stats.get('avg_duration', 0):.4f}s, "
-                        f"errors={self.metrics.error_count}"
+                        "Cycle %d: avg_duration=%.4fs, errors=%d",
+                        cycle_count, perf_stats.get('avg_duration', 0),
+                        self.metrics.error_count
                     )
 
         except KeyboardInterrupt:
@@ -223,7 +242,7 @@ class Quadruped:
             self._log_final_metrics(cycle_count)
         except Exception as e:
             self.metrics.record_error()
-            logger.error(f"Movement loop error: {e}", exc_info=True)
+            logger.error("Movement loop error: %s", e, exc_info=_LOG_TRACEBACKS)
             self._log_final_metrics(cycle_count)
             raise
 
@@ -1,14 +1,5 @@
 """Utility modules for quadruped robot firmware."""
 
-from src.utils.validators import (
-    validate_motor_id,
-    validate_angle,
-    validate_coordinate,
-    validate_leg_id,
-    validate_momentum,
-    validate_positive_number
-)
-
 __all__ = [
     'validate_motor_id',
     'validate_angle',
@@ -17,3 +8,11 @@ __all__ = [
     'validate_momentum',
     'validate_positive_number'
 ]
+
+
+def __getattr__(name):
+    """Import validators lazily on first access (keeps numpy off startup)."""
+    if name in __all__:
+        from src.utils import validators
+        return getattr(validators, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
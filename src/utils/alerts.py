@@ -1,7 +1,9 @@
 """Alert system for critical errors."""
 
+import logging
 import time
-from typing import Optional, List
+from collections import deque
+from typing import Optional, List, Deque
 from src.utils.logger import get_logger
 from src.utils.exceptions import QuadrupedError
 
@@ -13,8 +15,8 @@ class AlertSystem:
 
     def __init__(self):
         """Initialize alert system."""
-        self.alert_history: List[dict] = []
         self.max_history = 100
+        self.alert_history: Deque[dict] = deque(maxlen=self.max_history)
 
     def send_alert(
         self,
@@ -37,19 +39,18 @@ class AlertSystem:
             'timestamp': time.time()
         }
 
-        self.alert_history.append(alert)
-        if len(self.alert_history) > self.max_history:
-            self.alert_history.pop(0)
+        self.alert_history.append(alert)  # Oldest alert is evicted when full
 
         # Log alert
         if level == 'critical':
             logger.critical(f"CRITICAL ALERT: {message}")
-            if exception:
-                logger.critical(f"Exception: {exception}", exc_info=True)
+            # Only build the traceback when the record will actually be emitted
+            if exception and logger.isEnabledFor(logging.CRITICAL):
+                logger.critical("Exception: %s", exception, exc_info=exception)
         elif level == 'error':
             logger.error(f"ERROR ALERT: {message}")
-            if exception:
-                logger.error(f"Exception: {exception}", exc_info=True)
+            if exception and logger.isEnabledFor(logging.ERROR):
+                logger.error("Exception: %s", exception, exc_info=exception)
         else:
             logger.warning(f"WARNING ALERT: {message}")
 
@@ -63,7 +64,7 @@ class AlertSystem:
         Returns:
             List of recent alerts
         """
-        return self.alert_history[-limit:]
+        return list(self.alert_history)[-limit:]
 
     def clear_history(self) -> None:
         """Clear alert history."""
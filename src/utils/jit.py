@@ -0,0 +1,11 @@
+"""Optional Numba JIT support for numeric kernels."""
+
+# Numba is optional: without it decorated kernels run as plain Python
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit."""
+        return lambda func: func
+
+__all__ = ['njit']
@@ -1,8 +1,9 @@
 """Monitoring and metrics utilities for quadruped robot."""
 
 import time
-from typing import Dict, List, Optional
+import numpy as np
 from collections import deque
+from typing import Dict, List, Optional, Union
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -11,21 +12,61 @@ logger = get_logger(__name__)
 class RobotMetrics:
     """Collects and stores robot metrics."""
 
-    def __init__(self, history_size: int = 1000):
+    def __init__(self, history_size: int = 1000, record_trajectories: bool = False):
         """
         Initialize metrics collector.
 
+        History is kept in fixed-size ring buffers (one array per field) so
+        recording allocates nothing and statistics are NumPy reductions.
+
         Args:
             history_size: Maximum number of entries to keep in history
+                (0 disables movement and performance history)
+            record_trajectories: Whether record_movement stores trajectories
         """
         self.history_size = history_size
+        self.record_trajectories = record_trajectories
         self.motor_angles: Dict[int, float] = {}
         self.controller_status: Dict[str, bool] = {}
-        self.movement_history: deque = deque(maxlen=history_size)
-        self.performance_metrics: deque = deque(maxlen=history_size)
         self.error_count: int = 0
         self.start_time = time.time()
 
+        # Movement ring buffer
+        self._move_ts = np.zeros(history_size, dtype=np.float64)
+        self._move_momentum = np.zeros((history_size, 4), dtype=np.float32)
+        self._move_trajectory: List[Optional[np.ndarray]] = [None] * history_size
+        self._move_head = 0
+        self._move_count = 0
+
+        # Performance ring buffer (timestamps are time.perf_counter() readings)
+        self._perf_ts = np.zeros(history_size, dtype=np.float64)
+        self._perf_dur = np.zeros(history_size, dtype=np.float64)
+        self._perf_ops: List[Optional[str]] = [None] * history_size
+        self._perf_head = 0
+        self._perf_count = 0
+
+        # Running aggregates over the performance window: sum of durations
+        # and monotonic deques of (sequence, duration) for sliding min/max
+        self._perf_seq = 0
+        self._dur_sum = 0.0
+        self._min_deque: deque = deque()
+        self._max_deque: deque = deque()
+
+    def _ordered_indices(self, head: int, count: int) -> np.ndarray:
+        """
+        Get ring buffer indices from oldest to newest entry.
+
+        Args:
+            head: Index of the next slot to be written
+            count: Number of valid entries
+
+        Returns:
+            Array of buffer indices in chronological order
+        """
+        if count < self.history_size:
+            return np.arange(count)
+        return (head + np.arange(self.history_size)) % self.history_size
+
     def record_motor_angle(self, motor_id: int, angle: float) -> None:
         """
         Record motor angle.
@@ -46,35 +87,82 @@ class RobotMetrics:
         """
         self.controller_status[controller_name] = is_available
 
-    def record_movement(self, momentum: List[float], trajectory: Optional[List] = None) -> None:
+    def record_movement(
+        self,
+        momentum: Union[np.ndarray, List[float]],
+        trajectory: Optional[Union[np.ndarray, List]] = None
+    ) -> None:
         """
         Record movement command.
 
+        Values are copied into the history buffers, so callers may keep
+        reusing their arrays.
+
         Args:
             momentum: Momentum array [x, z, y, quit]
-            trajectory: Optional trajectory data
+            trajectory: Optional trajectory data, stored only when
+                record_trajectories is enabled
         """
-        entry = {
-            'timestamp': time.time(),
-            'momentum': momentum.copy() if hasattr(momentum, 'copy') else list(momentum),
-            'trajectory': trajectory
-        }
-        self.movement_history.append(entry)
+        if not self.history_size:
+            return
+        head = self._move_head
+        self._move_ts[head] = time.time()
+        self._move_momentum[head] = momentum[:4]
+        if self.record_trajectories and trajectory is not None:
+            self._move_trajectory[head] = np.array(trajectory, dtype=np.float32)
+        else:
+            self._move_trajectory[head] = None
 
-    def record_performance(self, operation: str, duration: float) -> None:
+        self._move_head = (head + 1) % self.history_size
+        if self._move_count < self.history_size:
+            self._move_count += 1
+
+    def record_performance(
+        self,
+        operation: str,
+        duration: float,
+        timestamp: Optional[float] = None
+    ) -> None:
         """
         Record performance metric.
 
         Args:
             operation: Name of the operation
             duration: Duration in seconds
+            timestamp: time.perf_counter() reading for the operation, usually
+                the start time the caller already took (default: now)
         """
-        entry = {
-            'timestamp': time.time(),
-            'operation': operation,
-            'duration': duration
-        }
-        self.performance_metrics.append(entry)
+        if not self.history_size:
+            return
+        head = self._perf_head
+        if self._perf_count == self.history_size:
+            # Slot is being overwritten - drop evicted duration from the sum
+            self._dur_sum -= self._perf_dur[head]
+        self._perf_ts[head] = time.perf_counter() if timestamp is None else timestamp
+        self._perf_dur[head] = duration
+        self._perf_ops[head] = operation
+        self._dur_sum += duration
+
+        self._perf_head = (head + 1) % self.history_size
+        if self._perf_count < self.history_size:
+            self._perf_count += 1
+
+        # Sliding window min/max
+        seq = self._perf_seq
+        self._perf_seq += 1
+        oldest = seq - self.history_size
+        min_deque = self._min_deque
+        while min_deque and min_deque[-1][1] >= duration:
+            min_deque.pop()
+        min_deque.append((seq, duration))
+        if min_deque[0][0] <= oldest:
+            min_deque.popleft()
+        max_deque = self._max_deque
+        while max_deque and max_deque[-1][1] <= duration:
+            max_deque.pop()
+        max_deque.append((seq, duration))
+        if max_deque[0][0] <= oldest:
+            max_deque.popleft()
 
     def record_error(self) -> None:
         """Record an error occurrence."""
@@ -108,10 +196,43 @@ class RobotMetrics:
         Returns:
             List of movement entries
         """
-        history = list(self.movement_history)
+        indices = self._ordered_indices(self._move_head, self._move_count)
+        if limit:
+            indices = indices[-limit:]
+        return [
+            {
+                'timestamp': float(self._move_ts[i]),
+                'momentum': self._move_momentum[i].tolist(),
+                'trajectory': (
+                    self._move_trajectory[i].tolist()
+                    if self._move_trajectory[i] is not None else None
+                )
+            }
+            for i in indices
+        ]
+
+    def get_performance_history(self, limit: Optional[int] = None) -> List[Dict]:
+        """
+        Get performance history.
+
+        Args:
+            limit: Maximum number of entries to return
+
+        Returns:
+            List of performance entries (timestamp is a time.perf_counter()
+            reading)
+        """
+        indices = self._ordered_indices(self._perf_head, self._perf_count)
         if limit:
-            return history[-limit:]
-        return history
+            indices = indices[-limit:]
+        return [
+            {
+                'timestamp': float(self._perf_ts[i]),
+                'operation': self._perf_ops[i],
+                'duration': float(self._perf_dur[i])
+            }
+            for i in indices
+        ]
 
     def get_performance_stats(self) -> Dict[str, float]:
         """
@@ -124,15 +245,14 @@ class RobotMetrics:
             - max_duration: Maximum operation duration in seconds
             - total_operations: Total number of operations recorded
         """
-        if not self.performance_metrics:
+        if not self._perf_count:
             return {}
 
-        durations = [m['duration'] for m in self.performance_metrics]
         return {
-            'avg_duration': sum(durations) / len(durations),
-            'min_duration': min(durations),
-            'max_duration': max(durations),
-            'total_operations': len(self.performance_metrics)
+            'avg_duration': float(self._dur_sum / self._perf_count),
+            'min_duration': float(self._min_deque[0][1]),
+            'max_duration': float(self._max_deque[0][1]),
+            'total_operations': self._perf_count
         }
 
     def get_uptime(self) -> float:
@@ -155,7 +275,7 @@ class RobotMetrics:
             'uptime': self.get_uptime(),
             'motor_angles': self.get_motor_angles(),
             'controller_status': self.get_controller_status(),
-            'movement_count': len(self.movement_history),
+            'movement_count': self._move_count,
             'error_count': self.error_count,
             'performance': self.get_performance_stats()
         }
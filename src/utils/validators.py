@@ -1,11 +1,35 @@
 """Input validation utilities for quadruped robot."""
 
+import array
+import logging
+import math
+import struct
+import numpy as np
 from typing import Any, Union
 from src.utils.exceptions import ValidationError
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Maximum magnitude allowed for the x, z, y momentum components
+MAX_MOMENTUM = 10.0
+
+# Types accepted as numeric values (coordinates, angles)
+_NUMERIC_TYPES = (int, float)
+
+# Packs a 4-element momentum sequence as float32 (skips numpy's sequence parser)
+_MOMENTUM_STRUCT = struct.Struct('4f')
+
+# array.array typecodes that are also numpy dtype codes (excludes 'u'/'w')
+_NUMERIC_TYPECODES = frozenset('bBhHiIlLqQfd')
+
+# Valid motor IDs (O(1) membership for ints)
+_MOTOR_RANGE = range(10)
+
+# Valid leg identifiers (tuple for messages, frozenset for lookups)
+_VALID_LEG_IDS = ('FL', 'FR', 'BL', 'BR')
+_LEG_IDS = frozenset(_VALID_LEG_IDS)
+
 
 def validate_motor_id(motor_id: int) -> None:
     """
@@ -17,7 +41,8 @@ def validate_motor_id(motor_id: int) -> None:
     Raises:
         ValidationError: If motor_id is invalid
     """
-    if not isinstance(motor_id, int) or not (0 <= motor_id < 10):
+    # Exact int check first; Motor members and other int subclasses fall back
+    if not (type(motor_id) is int or isinstance(motor_id, int)) or motor_id not in _MOTOR_RANGE:
         raise ValidationError(f"Invalid motor_id: {motor_id}. Must be integer in [0, 9]")
 
 
@@ -33,9 +58,9 @@ def validate_angle(angle: float, min_angle: float = 0.0, max_angle: float = 180.
     Raises:
         ValidationError: If angle is invalid
     """
-    if not isinstance(angle, (int, float)):
+    if type(angle) not in _NUMERIC_TYPES and not isinstance(angle, _NUMERIC_TYPES):
         raise ValidationError(f"Invalid angle type: {type(angle)}. Must be numeric")
-    
+
     if not (min_angle <= angle <= max_angle):
         raise ValidationError(
             f"Angle {angle} out of range [{min_angle}, {max_angle}]"
@@ -53,11 +78,50 @@ def validate_coordinate(value: Any, name: str = "coordinate") -> None:
     Raises:
         ValidationError: If coordinate is invalid
     """
-    if not isinstance(value, (int, float)):
-        raise ValidationError(f"Invalid {name}: {value}. Must be numeric")
+    try:
+        valid = (
+            (type(value) in _NUMERIC_TYPES or isinstance(value, _NUMERIC_TYPES)) and
+            math.isfinite(value)
+        )
+    except OverflowError:
+        # Python int too large to convert to float
+        valid = False
+    if not valid:
+        raise ValidationError(f"Invalid {name}: {value}. Must be a finite number")
+
+
+def validate_xyz(x: Any, y: Any, z: Any) -> None:
+    """
+    Validate an (x, y, z) coordinate triple with a single check.
 
+    Exact int/float types take the fast path; subclasses such as
+    numpy.float64 fall back to isinstance. NaN and infinity are rejected.
 
-def validate_leg_id(leg_id: str, valid_ids: tuple = ('FL', 'FR', 'BL', 'BR')) -> None:
+    Args:
+        x: X coordinate value
+        y: Y coordinate value
+        z: Z coordinate value
+
+    Raises:
+        ValidationError: If any coordinate is not numeric
+    """
+    try:
+        valid = (
+            (type(x) in _NUMERIC_TYPES or isinstance(x, _NUMERIC_TYPES)) and
+            (type(y) in _NUMERIC_TYPES or isinstance(y, _NUMERIC_TYPES)) and
+            (type(z) in _NUMERIC_TYPES or isinstance(z, _NUMERIC_TYPES)) and
+            math.isfinite(x) and math.isfinite(y) and math.isfinite(z)
+        )
+    except OverflowError:
+        # Python int too large to convert to float
+        valid = False
+    if not valid:
+        raise ValidationError(
+            f"Invalid coordinates: ({x!r}, {y!r}, {z!r}). Must be finite numbers"
+        )
+
+
+def validate_leg_id(leg_id: str, valid_ids: tuple = _VALID_LEG_IDS) -> None:
     """
     Validate leg identifier.
 
@@ -68,12 +132,35 @@ def validate_leg_id(leg_id: str, valid_ids: tuple = ('FL', 'FR', 'BL', 'BR')) ->
     Raises:
         ValidationError: If leg_id is invalid
     """
-    if not isinstance(leg_id, str) or leg_id not in valid_ids:
+    if type(leg_id) is not str:
+        raise ValidationError(f"Invalid leg_id type: {type(leg_id)}. Must be str")
+
+    # Hashed lookup for the default IDs, plain membership for custom ones
+    if leg_id not in (_LEG_IDS if valid_ids is _VALID_LEG_IDS else valid_ids):
         raise ValidationError(
             f"Invalid leg_id: {leg_id}. Must be one of {valid_ids}"
         )
 
 
+def _sequence_to_array(momentum: Union[list, tuple]) -> np.ndarray:
+    """
+    Convert a momentum list/tuple to an array for validation.
+
+    Args:
+        momentum: Momentum sequence
+
+    Returns:
+        Float32 array for 4 packable numbers, otherwise np.asarray(momentum)
+    """
+    if len(momentum) == 4:
+        try:
+            return np.frombuffer(_MOMENTUM_STRUCT.pack(*momentum), dtype=np.float32)
+        except (struct.error, OverflowError):
+            # Non-numeric or beyond float32 range - let the generic path report it
+            pass
+    return np.asarray(momentum)
+
+
 def validate_momentum(momentum: Any) -> None:
     """
     Validate momentum array.
@@ -84,24 +171,74 @@ def validate_momentum(momentum: Any) -> None:
     Raises:
         ValidationError: If momentum is invalid
     """
-    import numpy as np
-    
-    if not isinstance(momentum, (np.ndarray, list, tuple)):
-        raise ValidationError(f"Invalid momentum type: {type(momentum)}")
-    
-    momentum_array = np.asarray(momentum)
-    
+    # Exact-type dispatch first: float32 ndarray is the hot-path input
+    momentum_type = type(momentum)
+    if momentum_type is np.ndarray:
+        momentum_array = momentum
+    elif momentum_type is array.array:
+        if momentum.typecode not in _NUMERIC_TYPECODES:
+            raise ValidationError(
+                f"Invalid momentum type: array.array('{momentum.typecode}'). "
+                f"Must be numeric"
+            )
+        # Zero-copy view through the buffer protocol
+        momentum_array = np.frombuffer(momentum, dtype=momentum.typecode)
+    elif momentum_type is list or momentum_type is tuple:
+        momentum_array = _sequence_to_array(momentum)
+    elif isinstance(momentum, np.ndarray):
+        momentum_array = momentum
+    elif isinstance(momentum, (list, tuple, array.array)):
+        momentum_array = np.asarray(momentum)
+    else:
+        raise ValidationError(f"Invalid momentum type: {momentum_type}")
+
     if len(momentum_array) < 4:
         raise ValidationError(
             f"Invalid momentum length: {len(momentum_array)}. Must be >= 4"
         )
-    
-    if momentum_array.dtype != np.float32:
+
+    if momentum_array.dtype.kind not in 'biuf':
+        raise ValidationError(
+            f"Invalid momentum values: {momentum_array}. Must be numeric"
+        )
+
+    if not (np.isfinite(momentum_array).all() and
+            (np.abs(momentum_array[:3]) <= MAX_MOMENTUM).all()):
+        raise ValidationError(
+            f"Invalid momentum values: {momentum_array}. "
+            f"Must be finite with |x|, |z|, |y| <= {MAX_MOMENTUM}"
+        )
+
+    if momentum_array.dtype != np.float32 and logger.isEnabledFor(logging.WARNING):
         logger.warning(
-            f"Momentum dtype is {momentum_array.dtype}, expected float32"
+            "Momentum dtype is %s, expected float32", momentum_array.dtype
         )
 
 
+def validate_tick(momentum: Any) -> None:
+    """
+    Validate controller output once per movement cycle.
+
+    Fuses the momentum checks into a single pass for the 1-D float32 array
+    returned by the controllers; any other input, or a value failing the
+    fast check, goes through validate_momentum for the detailed error.
+
+    Args:
+        momentum: Momentum returned by the controller
+
+    Raises:
+        ValidationError: If momentum is invalid
+    """
+    if (type(momentum) is np.ndarray and momentum.dtype == np.float32 and
+            momentum.ndim == 1 and momentum.shape[0] >= 4):
+        # NaN propagates through min/max and fails the comparisons
+        head = momentum[:3]
+        if (head.min() >= -MAX_MOMENTUM and head.max() <= MAX_MOMENTUM and
+                np.isfinite(momentum[3:]).all()):
+            return
+    validate_momentum(momentum)
+
+
 def validate_positive_number(value: Any, name: str = "value", min_value: float = 0.0) -> None:
     """
     Validate positive number.
@@ -0,0 +1,47 @@
+"""Shared test setup: servo hardware stub and socket helpers."""
+
+import sys
+import types
+
+import pytest
+
+
+class _FakeServo:
+    """Servo channel stub that accepts and discards all writes."""
+
+    __slots__ = ('angle',)
+
+    def __init__(self):
+        self.angle = None
+
+    def set_pulse_width_range(self, min_pulse, max_pulse):
+        """Accept pulse width configuration without touching hardware."""
+
+
+class _FakeServoKit:
+    """Stand-in for adafruit_servokit.ServoKit."""
+
+    def __init__(self, channels=16, **kwargs):
+        self.servo = [_FakeServo() for _ in range(channels)]
+
+
+# Installed before any test module imports src.hardware.servo_controller,
+# so every Quadruped in the suite talks to the stub instead of I2C
+_fake_module = types.ModuleType('adafruit_servokit')
+_fake_module.ServoKit = _FakeServoKit
+sys.modules['adafruit_servokit'] = _fake_module
+
+
+def _fake_datagram(data, addr):
+    """Build a recvfrom_into side effect that delivers a single datagram."""
+    def recvfrom_into(buffer, nbytes=0, flags=0):
+        chunk = data[:nbytes or len(buffer)]
+        buffer[:len(chunk)] = chunk
+        return len(chunk), addr
+    return recvfrom_into
+
+
+@pytest.fixture
+def fake_datagram():
+    """Factory for socket.recvfrom_into side effects delivering one datagram."""
+    return _fake_datagram
@@ -0,0 +1,77 @@
+"""Tests for configuration loading and the JSON cache."""
+
+import datetime
+import json
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+from src.config.config_loader import load_config
+
+
+def write_yaml(path, text, mtime):
+    """Write a YAML file and pin its modification time."""
+    path.write_text(text)
+    os.utime(path, (mtime, mtime))
+
+
+class TestConfigCache:
+    """Test the JSON cache stored next to YAML configuration files."""
+
+    def test_cache_hit(self, tmp_path):
+        """Test a cache at least as new as the YAML is used instead of parsing."""
+        config_file = tmp_path / 'robot.yaml'
+        write_yaml(config_file, 'robot:\n  legs: {upper_length: 10.0}\n', 1000)
+
+        assert load_config(config_file) == {'robot': {'legs': {'upper_length': 10.0}}}
+        cache_file = tmp_path / 'robot.yaml.json'
+        assert cache_file.exists()
+
+        # Marker content only reachable through the cache
+        cache_file.write_text(json.dumps({'cached': True}))
+        os.utime(cache_file, (2000, 2000))
+        assert load_config(config_file) == {'cached': True}
+
+    def test_newer_yaml_is_reparsed(self, tmp_path):
+        """Test a YAML file newer than its cache is parsed again."""
+        config_file = tmp_path / 'robot.yaml'
+        write_yaml(config_file, 'value: 1\n', 1000)
+        assert load_config(config_file) == {'value': 1}
+        cache_file = tmp_path / 'robot.yaml.json'
+        os.utime(cache_file, (1500, 1500))
+
+        write_yaml(config_file, 'value: 2\n', 2000)
+
+        assert load_config(config_file) == {'value': 2}
+        assert json.loads(cache_file.read_text()) == {'value': 2}
+
+    def test_non_round_trippable_config_not_cached(self, tmp_path):
+        """Test configs JSON cannot represent exactly are never cached."""
+        config_file = tmp_path / 'robot.yaml'
+        write_yaml(
+            config_file,
+            'calibration: {0: 60}\nflags: {true: 1}\ncreated: 2024-01-02\n',
+            1000
+        )
+        expected = {
+            'calibration': {0: 60},
+            'flags': {True: 1},
+            'created': datetime.date(2024, 1, 2)
+        }
+
+        assert load_config(config_file) == expected
+        assert load_config(config_file) == expected
+        assert not (tmp_path / 'robot.yaml.json').exists()
+
+        write_yaml(config_file, 'calibration: {0: 60}\n', 2000)
+        assert load_config(config_file) == {'calibration': {0: 60}}
+        assert not (tmp_path / 'robot.yaml.json').exists()
+
+    def test_cache_write_failure(self, tmp_path):
+        """Test a failing cache write still returns the parsed config."""
+        config_file = tmp_path / 'robot.yaml'
+        write_yaml(config_file, 'value: 1\n', 1000)
+
+        with patch.object(Path, 'write_text', side_effect=OSError('read-only')):
+            assert load_config(config_file) == {'value': 1}
+        assert not (tmp_path / 'robot.yaml.json').exists()
@@ -0,0 +1,38 @@
+"""Tests for the control entry point."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Runs main() with --help in a fresh interpreter and reports whether numpy
+# was imported along the way
+_HELP_SCRIPT = """
+import sys
+sys.argv = ['main.py', '--help']
+from src.control_quadruped import main
+try:
+    main()
+except SystemExit:
+    pass
+print('numpy' in sys.modules)
+"""
+
+
+class TestControlEntryPoint:
+    """Test the command line entry point."""
+
+    def test_help_does_not_import_numpy(self, tmp_path):
+        """Test --help stays free of numpy (heavy imports are deferred)."""
+        result = subprocess.run(
+            [sys.executable, '-c', _HELP_SCRIPT],
+            cwd=tmp_path,
+            env={'PYTHONPATH': str(PROJECT_ROOT)},
+            capture_output=True,
+            text=True,
+            check=True
+        )
+
+        assert 'Quadruped Robot Control System' in result.stdout
+        assert result.stdout.strip().splitlines()[-1] == 'False'
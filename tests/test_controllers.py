@@ -9,50 +9,104 @@ from src.utils.exceptions import ValidationError, ControllerError
 class TestKeyboardController:
     """Test keyboard controller."""
 
-    @patch('controllers.local_keyboard_controller.keyboard')
+    @staticmethod
+    def press(mock_keyboard, *keys):
+        """Report the given keys as held down."""
+        from src.controllers.local_keyboard_controller import _SCAN
+
+        held = {_SCAN[key] for key in keys}
+        mock_keyboard.is_pressed.side_effect = lambda key: key in held
+
+    @patch('src.controllers.local_keyboard_controller.keyboard')
     def test_controller_forward(self, mock_keyboard):
         """Test forward movement."""
-        from controllers.local_keyboard_controller import controller
+        from src.controllers.local_keyboard_controller import controller
 
-        mock_keyboard.is_pressed.side_effect = lambda key: key == 'w'
+        self.press(mock_keyboard, 'w')
         momentum = np.array([0.0, 0.0, 1.0, 0.0], dtype=np.float32)
 
         result = controller(momentum, accel=0.1, bound=4.0)
         assert result[0] > 0  # Forward momentum increased
 
-    @patch('controllers.local_keyboard_controller.keyboard')
+    @patch('src.controllers.local_keyboard_controller.keyboard')
     def test_controller_backward(self, mock_keyboard):
         """Test backward movement."""
-        from controllers.local_keyboard_controller import controller
+        from src.controllers.local_keyboard_controller import controller
 
-        mock_keyboard.is_pressed.side_effect = lambda key: key == 's'
+        self.press(mock_keyboard, 's')
         momentum = np.array([0.0, 0.0, 1.0, 0.0], dtype=np.float32)
 
         result = controller(momentum, accel=0.1, bound=4.0)
         assert result[0] < 0  # Backward momentum
 
-    @patch('controllers.local_keyboard_controller.keyboard')
+    @pytest.mark.parametrize("keys, expected", [
+        ((), (0.0, 0.0)),
+        (('w',), (0.1, 0.0)),
+        (('s',), (-0.1, 0.0)),
+        (('d',), (0.0, 0.1)),
+        (('a',), (0.0, -0.1)),
+        (('w', 's'), (0.0, 0.0)),
+        (('a', 'd'), (0.0, 0.0)),
+        (('w', 'd'), (0.1, 0.1)),
+        (('w', 's', 'a'), (0.0, -0.1)),
+    ])
+    @patch('src.controllers.local_keyboard_controller.keyboard')
+    def test_controller_key_combinations(self, mock_keyboard, keys, expected):
+        """Test every key combination maps to the expected direction."""
+        from src.controllers.local_keyboard_controller import controller
+
+        self.press(mock_keyboard, *keys)
+        momentum = np.array([0.0, 0.0, 1.0, 0.0], dtype=np.float32)
+
+        result = controller(momentum, accel=0.1, bound=4.0, poll_hz=None)
+        assert np.allclose(result, [expected[0], expected[1], 1.0, 0.0])
+
+    @patch('src.controllers.local_keyboard_controller.keyboard')
     def test_controller_bounds(self, mock_keyboard):
         """Test momentum bounds."""
-        from controllers.local_keyboard_controller import controller
+        from src.controllers.local_keyboard_controller import controller
 
-        mock_keyboard.is_pressed.side_effect = lambda key: key == 'w'
+        self.press(mock_keyboard, 'w')
         momentum = np.array([4.0, 0.0, 1.0, 0.0], dtype=np.float32)  # Already at bound
 
         result = controller(momentum, accel=0.1, bound=4.0)
         assert result[0] == 4.0  # Should not exceed bound
 
+    @patch('src.controllers.local_keyboard_controller.keyboard')
+    def test_controller_clamps_both_axes(self, mock_keyboard):
+        """Test momentum is clamped to +/-bound on both axes."""
+        from src.controllers.local_keyboard_controller import controller
+
+        self.press(mock_keyboard, 'w', 'a')
+        momentum = np.array([3.95, -3.95, 1.0, 0.0], dtype=np.float32)
+
+        result = controller(momentum, accel=0.1, bound=4.0, poll_hz=None)
+        assert np.array_equal(result, np.array([4.0, -4.0, 1.0, 0.0], dtype=np.float32))
+
     def test_controller_invalid_accel(self):
         """Test invalid acceleration parameter."""
-        from controllers.local_keyboard_controller import controller
+        from src.controllers.local_keyboard_controller import controller
 
         momentum = np.array([0.0, 0.0, 1.0, 0.0], dtype=np.float32)
         with pytest.raises(ValidationError, match="Invalid accel"):
             controller(momentum, accel=-1, bound=4)
+        with pytest.raises(ValidationError, match="Invalid accel"):
+            controller(momentum, accel=2, bound=4)
+
+    @pytest.mark.parametrize("accel", [np.array(0.1), [0.1]])
+    def test_controller_non_scalar_accel(self, accel):
+        """Test unhashable accel values are rejected as invalid, not cached."""
+        from src.controllers.local_keyboard_controller import controller
+
+        momentum = np.array([0.0, 0.0, 1.0, 0.0], dtype=np.float32)
+        with pytest.raises(ValidationError, match="Invalid accel type"):
+            controller(momentum, accel=accel, bound=4)
+        with pytest.raises(ValidationError, match="Invalid bound type"):
+            controller(momentum, accel=0.1, bound=[accel])
 
     def test_controller_invalid_bound(self):
         """Test invalid bound parameter."""
-        from controllers.local_keyboard_controller import controller
+        from src.controllers.local_keyboard_controller import controller
 
         momentum = np.array([0.0, 0.0, 1.0, 0.0], dtype=np.float32)
         with pytest.raises(ValidationError, match="Invalid bound"):
@@ -63,19 +117,18 @@ class TestNetworkReceiver:
     """Test network receiver controller."""
 
     @patch('src.controllers.network_receiver.s')
-    def test_controller_receives_data(self, mock_socket):
+    def test_controller_receives_data(self, mock_socket, fake_datagram):
         """Test receiving valid data."""
         from src.controllers.network_receiver import controller
 
         # Mock socket receive
         test_data = np.array([1.0, 0.5, 1.0, 0.0], dtype=np.float32).tobytes()
-        mock_socket.recvfrom.return_value = (test_data, ('192.168.1.1', 5000))
-        mock_socket.settimeout = Mock()
+        mock_socket.recvfrom_into.side_effect = fake_datagram(test_data, ('192.168.1.1', 5000))
 
         momentum = np.array([0.0, 0.0, 1.0, 0.0], dtype=np.float32)
         result = controller(momentum)
 
-        assert np.allclose(result[:3], [1.0, 0.5, 1.0])
+        assert np.array_equal(result[:3], np.array([1.0, 0.5, 1.0], dtype=np.float32))
 
     @patch('src.controllers.network_receiver.s')
     def test_controller_timeout(self, mock_socket):
@@ -83,29 +136,43 @@ class TestNetworkReceiver:
         import socket
         from src.controllers.network_receiver import controller
 
-        mock_socket.recvfrom.side_effect = socket.timeout()
-        mock_socket.settimeout = Mock()
+        mock_socket.recvfrom_into.side_effect = socket.timeout()
 
         momentum = np.array([1.0, 0.5, 1.0, 0.0], dtype=np.float32)
         result = controller(momentum)
 
         # Should return original momentum on timeout
-        assert np.allclose(result, momentum)
+        assert np.array_equal(result, momentum)
+
+    @patch('src.controllers.network_receiver.s')
+    def test_controller_no_data(self, mock_socket):
+        """Test an empty non-blocking socket leaves momentum unchanged."""
+        from src.controllers import network_receiver
+        from src.controllers.network_receiver import controller
+
+        mock_socket.recvfrom_into.side_effect = BlockingIOError()
+        network_receiver.controller._error_count = 3
+
+        momentum = np.array([1.0, 0.5, 1.0, 0.0], dtype=np.float32)
+        result = controller(momentum, poll_hz=None)
+
+        assert result is momentum
+        assert np.array_equal(result, np.array([1.0, 0.5, 1.0, 0.0], dtype=np.float32))
+        assert network_receiver.controller._error_count == 0
 
     @patch('src.controllers.network_receiver.s')
-    def test_controller_incomplete_data(self, mock_socket):
+    def test_controller_incomplete_data(self, mock_socket, fake_datagram):
         """Test handling of incomplete data."""
         from src.controllers.network_receiver import controller
 
         # Incomplete data (less than 16 bytes)
-        mock_socket.recvfrom.return_value = (b'\x00' * 8, ('192.168.1.1', 5000))
-        mock_socket.settimeout = Mock()
+        mock_socket.recvfrom_into.side_effect = fake_datagram(b'\x00' * 8, ('192.168.1.1', 5000))
 
         momentum = np.array([1.0, 0.5, 1.0, 0.0], dtype=np.float32)
         result = controller(momentum)
 
         # Should return original momentum
-        assert np.allclose(result, momentum)
+        assert np.array_equal(result, momentum)
 
     @patch('src.controllers.network_receiver.s')
     def test_controller_consecutive_errors(self, mock_socket):
@@ -114,8 +181,7 @@ class TestNetworkReceiver:
         from src.controllers.network_receiver import controller
 
         # Simulate consecutive errors
-        mock_socket.recvfrom.side_effect = socket.error("Connection failed")
-        mock_socket.settimeout = Mock()
+        mock_socket.recvfrom_into.side_effect = socket.error("Connection failed")
 
         momentum = np.array([0.0, 0.0, 1.0, 0.0], dtype=np.float32)
 
@@ -128,3 +194,71 @@ class TestNetworkReceiver:
         with pytest.raises(ControllerError):
             controller(momentum)
 
+
+
+class TestPollThrottle:
+    """Test the controller polling rate limiter."""
+
+    @patch('src.controllers.utils.throttle.time')
+    def test_wait_sleeps_remaining_interval(self, mock_time):
+        """Test wait sleeps only for the rest of the polling interval."""
+        from src.controllers.utils.throttle import PollThrottle
+
+        throttle = PollThrottle()
+        mock_time.monotonic.side_effect = [10.0, 10.0, 10.001, 10.004]
+
+        throttle.wait(200)  # First call: last poll long ago, no wait
+        throttle.wait(200)  # 1ms since last poll: sleep the remaining 4ms
+
+        sleeps = [call.args[0] for call in mock_time.sleep.call_args_list]
+        assert sleeps[0] == 0.0
+        assert sleeps[1] == pytest.approx(0.004)
+
+    @patch('src.controllers.utils.throttle.time')
+    def test_wait_disabled(self, mock_time):
+        """Test poll_hz of None or 0 disables throttling."""
+        from src.controllers.utils.throttle import PollThrottle
+
+        throttle = PollThrottle()
+        throttle.wait(None)
+        throttle.wait(0)
+
+        mock_time.sleep.assert_not_called()
+        mock_time.monotonic.assert_not_called()
+
+
+class TestSocketConnection:
+    """Test UDP socket port selection."""
+
+    @patch('src.controllers.utils.ip_helper.get_ip', return_value='127.0.0.1')
+    @patch('src.controllers.utils.ip_helper.socket.socket')
+    def test_skips_port_in_use(self, mock_socket_cls, mock_get_ip):
+        """Test a port in use is skipped for the next probed port."""
+        import errno
+        from src.controllers.utils.ip_helper import create_socket_connection
+
+        sock = mock_socket_cls.return_value
+        sock.bind.side_effect = [OSError(errno.EADDRINUSE, 'Address in use'), None]
+
+        assert create_socket_connection() is sock
+        assert [call.args[0] for call in sock.bind.call_args_list] == [
+            ('127.0.0.1', 5000), ('127.0.0.1', 5005)
+        ]
+        sock.close.assert_not_called()
+
+    @patch('src.controllers.utils.ip_helper.get_ip', return_value='127.0.0.1')
+    @patch('src.controllers.utils.ip_helper.socket.socket')
+    def test_other_bind_error_propagates(self, mock_socket_cls, mock_get_ip):
+        """Test bind errors other than port in use close the socket and re-raise."""
+        import errno
+        from src.controllers.utils.ip_helper import create_socket_connection
+
+        sock = mock_socket_cls.return_value
+        sock.bind.side_effect = OSError(errno.EACCES, 'Permission denied')
+
+        with pytest.raises(OSError) as exc_info:
+            create_socket_connection()
+
+        assert exc_info.value.errno == errno.EACCES
+        assert sock.bind.call_count == 1
+        sock.close.assert_called_once()
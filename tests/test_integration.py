@@ -7,25 +7,39 @@ from src.robot.quadruped import Quadruped
 from src.hardware.servo_controller import Motor
 
 
+class _CountStub:
+    """Cheap stand-in for Mock that only counts calls and keeps the last args."""
+
+    __slots__ = ('call_count', 'last_args')
+
+    def __init__(self):
+        self.call_count = 0
+        self.last_args = None
+
+    def __call__(self, *args, **kwargs):
+        self.call_count += 1
+        self.last_args = args
+        return True
+
+
 class TestMovementCycle:
     """Integration tests for movement cycle."""
 
     @pytest.fixture
-    def mock_quadruped(self, mocker):
+    def mock_quadruped(self):
         """Create a mock Quadruped instance."""
-        mocker.patch('src.hardware.servo_controller.ServoKit')
         config = {
             'robot': {
                 'legs': {'upper_length': 10.0, 'lower_length': 10.5},
                 'servos': {'channels': 16, 'pulse_min': 500, 'pulse_max': 2500},
                 'offsets': {'shoulder': 10, 'elbow': 20, 'hip': 0},
-                'calibration': {},
                 'kinematics': {'hip_offset': 2.0}
             }
         }
         quad = Quadruped(config)
         # Mock servo controller methods
-        quad.servo_controller.set_angle = Mock(return_value=True)
+        quad.servo_controller.set_angle = _CountStub()
+        quad.servo_controller.set_angles = _CountStub()
         return quad
 
     def test_movement_cycle_basic(self, mock_quadruped):
@@ -40,8 +54,8 @@ class TestMovementCycle:
 
         mock_quadruped.move(test_controller)
 
-        # Should have called set_angle multiple times (4 legs * iterations)
-        assert mock_quadruped.servo_controller.set_angle.call_count > 0
+        # Should have written all legs once per iteration
+        assert mock_quadruped.servo_controller.set_angles.call_count > 0
 
     def test_movement_cycle_quit_flag(self, mock_quadruped):
         """Test movement cycle respects quit flag."""
@@ -83,13 +97,60 @@ class TestMovementCycle:
         assert length > 0
         assert trajectory.shape[0] == 3  # x, z, y coordinates
 
+    def test_kinematics_shared_across_legs(self, mock_quadruped):
+        """Test all legs are solved by the single Quadruped kinematics instance."""
+        kinematics = mock_quadruped.kinematics
+        assert mock_quadruped.gait_controller.kinematics is kinematics
+
+        solved = []
+        calculate_into = kinematics.calculate_into
+
+        def spy(out, x, y, z, right):
+            solved.append(len(x))
+            return calculate_into(out, x, y, z, right)
+
+        kinematics.calculate_into = spy
+
+        def quit_controller(momentum):
+            momentum[3] = 1.0 if solved else 0.0
+            return momentum
+
+        mock_quadruped.move(quit_controller)
+
+        # One step solved all four legs through the shared instance
+        assert solved == [4]
+
+    @pytest.mark.parametrize("right", [True, False, np.bool_(True), np.bool_(False), None, 2])
+    def test_apply_trajectory_to_leg_side_flag(self, mock_quadruped, right):
+        """Test apply_trajectory_to_leg accepts any truthy/falsy side flag."""
+        mock_quadruped.gait_controller.apply_trajectory_to_leg(
+            0, 1, 1.0, 15.0, 2.0, hip_motor=2, right=right
+        )
+
+        set_angle = mock_quadruped.servo_controller.set_angle
+        assert set_angle.call_count == 3
+        expected = mock_quadruped.kinematics.calculate(1.0, 15.0, z=2.0, right=bool(right))
+        assert set_angle.last_args == (2, expected[2])
+
     def test_calibration_sequence(self, mock_quadruped):
         """Test calibration sets all motors."""
         result = mock_quadruped.calibrate()
 
         assert result is True
-        # Should have called set_angle for all motors
-        assert mock_quadruped.servo_controller.set_angle.call_count >= 9
+        # Should have set all motors in one batch
+        set_angles = mock_quadruped.servo_controller.set_angles
+        assert set_angles.call_count == 1
+        motor_ids, angles = set_angles.last_args
+        assert len(motor_ids) >= 9
+        assert len(angles) == len(motor_ids)
+
+    def test_calibration_empty_config(self, mock_quadruped):
+        """Test an explicit empty calibration moves no motors."""
+        mock_quadruped.calibration_angles = {}
+
+        assert mock_quadruped.calibrate() is True
+        motor_ids, angles = mock_quadruped.servo_controller.set_angles.last_args
+        assert len(motor_ids) == 0 and len(angles) == 0
 
 
 class TestControllerIntegration:
@@ -107,18 +168,26 @@ class TestControllerIntegration:
 
             assert result[0] > 0  # Forward momentum
 
-    def test_network_receiver_integration(self):
+    def test_keyboard_controller_bound_above_max_momentum(self):
+        """Test keyboard controller rejects bounds the movement loop would refuse."""
+        from src.controllers.local_keyboard_controller import controller
+        from src.utils.exceptions import ValidationError
+
+        momentum = np.array([0.0, 0.0, 1.0, 0.0], dtype=np.float32)
+        with pytest.raises(ValidationError, match="Invalid bound"):
+            controller(momentum, accel=0.1, bound=12, poll_hz=None)
+
+    def test_network_receiver_integration(self, fake_datagram):
         """Test network receiver with mock socket."""
         from src.controllers.network_receiver import controller
         import socket
 
         with patch('src.controllers.network_receiver.s') as mock_socket:
             test_data = np.array([1.0, 0.5, 1.0, 0.0], dtype=np.float32).tobytes()
-            mock_socket.recvfrom.return_value = (test_data, ('127.0.0.1', 5000))
-            mock_socket.settimeout = Mock()
+            mock_socket.recvfrom_into.side_effect = fake_datagram(test_data, ('127.0.0.1', 5000))
 
             momentum = np.array([0.0, 0.0, 1.0, 0.0], dtype=np.float32)
             result = controller(momentum)
 
-            assert np.allclose(result[:3], [1.0, 0.5, 1.0])
+            assert np.array_equal(result[:3], np.array([1.0, 0.5, 1.0], dtype=np.float32))
 
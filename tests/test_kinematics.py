@@ -12,9 +12,8 @@ class TestInverseKinematics:
     """Test inverse kinematics calculations."""
 
     @pytest.fixture
-    def mock_quadruped(self, mocker):
+    def mock_quadruped(self):
         """Create a mock Quadruped instance."""
-        mocker.patch('src.hardware.servo_controller.ServoKit')
         config = {
             'robot': {
                 'legs': {'upper_length': 10.0, 'lower_length': 10.5},
@@ -64,3 +63,46 @@ class TestInverseKinematics:
         assert abs(InverseKinematics.rad_to_degree(np.pi / 2) - 90) < 0.01
         assert abs(InverseKinematics.rad_to_degree(0) - 0) < 0.01
 
+    def test_kinematics_position_too_close(self):
+        """Test kinematics rejects positions inside the minimum reach."""
+        kinematics = InverseKinematics()
+        with pytest.raises(KinematicsError, match="Position unreachable"):
+            kinematics.calculate(0.1, 0.2, z=0, right=True)
+        with pytest.raises(KinematicsError, match="Position unreachable"):
+            kinematics.calculate_into(
+                np.empty((3, 2)), np.array([5.0, 0.1]), np.array([15.0, 0.2]),
+                np.zeros(2), np.array([True, True])
+            )
+
+    def test_side_specialized_solvers(self):
+        """Test calculate_right/calculate_left match calculate with the side flag."""
+        kinematics = InverseKinematics()
+        assert np.allclose(
+            kinematics.calculate_right(1.0, 15.0, 2.0),
+            kinematics.calculate(1.0, 15.0, z=2.0, right=True)
+        )
+        assert np.allclose(
+            kinematics.calculate_left(1.0, 15.0, 2.0),
+            kinematics.calculate(1.0, 15.0, z=2.0, right=False)
+        )
+
+    def test_calculate_into_matches_scalar(self):
+        """Test calculate_into fills the output buffer like per-point calculate."""
+        kinematics = InverseKinematics()
+        xs = np.array([1.0, 2.0, -1.0, 0.5])
+        ys = np.array([15.0, 12.0, 16.0, 14.0])
+        zs = np.array([2.0, -3.0, 0.0, 1.0])
+        rights = np.array([True, False, True, False])
+        out = np.empty((3, 4))
+
+        result = kinematics.calculate_into(out, xs, ys, zs, rights)
+
+        assert result is out
+        for i in range(4):
+            expected = kinematics.calculate(xs[i], ys[i], z=zs[i], right=bool(rights[i]))
+            assert np.allclose(out[:, i], expected)
+        with pytest.raises(KinematicsError, match="Position unreachable"):
+            kinematics.calculate_into(
+                out, np.array([5.0, 50.0]), np.array([15.0, 15.0]),
+                np.zeros(2), np.array([True, True])
+            )
@@ -0,0 +1,81 @@
+"""Tests for monitoring utilities."""
+
+import numpy as np
+from src.utils.monitoring import RobotMetrics
+
+
+class TestRobotMetrics:
+    """Test metrics ring buffers."""
+
+    def test_performance_stats(self):
+        """Test performance statistics."""
+        metrics = RobotMetrics(history_size=10)
+        assert metrics.get_performance_stats() == {}
+
+        for duration in (0.1, 0.3, 0.2):
+            metrics.record_performance('movement_cycle', duration)
+
+        stats = metrics.get_performance_stats()
+        assert abs(stats['avg_duration'] - 0.2) < 1e-9
+        assert stats['min_duration'] == 0.1
+        assert stats['max_duration'] == 0.3
+        assert stats['total_operations'] == 3
+
+    def test_performance_stats_wraparound(self):
+        """Test old entries are evicted when history is full."""
+        metrics = RobotMetrics(history_size=3)
+        for duration in (5.0, 1.0, 2.0, 3.0):
+            metrics.record_performance('movement_cycle', duration)
+
+        stats = metrics.get_performance_stats()
+        assert stats['max_duration'] == 3.0
+        assert stats['min_duration'] == 1.0
+        assert stats['total_operations'] == 3
+
+    def test_performance_history(self):
+        """Test performance history keeps operation names and timestamps."""
+        metrics = RobotMetrics(history_size=2)
+        metrics.record_performance('calibrate', 0.5, 10.0)
+        metrics.record_performance('movement_cycle', 0.1, 11.0)
+        metrics.record_performance('movement_cycle', 0.2, 12.0)
+
+        history = metrics.get_performance_history()
+        assert history == [
+            {'timestamp': 11.0, 'operation': 'movement_cycle', 'duration': 0.1},
+            {'timestamp': 12.0, 'operation': 'movement_cycle', 'duration': 0.2},
+        ]
+        assert metrics.get_performance_history(limit=1) == history[-1:]
+
+    def test_zero_history_size(self):
+        """Test history_size=0 records nothing instead of failing."""
+        metrics = RobotMetrics(history_size=0)
+        metrics.record_performance('movement_cycle', 0.1)
+        metrics.record_movement(np.array([1.0, 0.0, 1.0, 0.0], dtype=np.float32))
+
+        assert metrics.get_performance_stats() == {}
+        assert metrics.get_performance_history() == []
+        assert metrics.get_movement_history() == []
+        assert metrics.get_summary()['movement_count'] == 0
+
+    def test_movement_history_order(self):
+        """Test movement history is returned oldest first."""
+        metrics = RobotMetrics(history_size=3)
+        for i in range(5):
+            metrics.record_movement(np.array([i, 0.0, 1.0, 0.0], dtype=np.float32))
+
+        history = metrics.get_movement_history()
+        assert [entry['momentum'][0] for entry in history] == [2.0, 3.0, 4.0]
+        assert metrics.get_movement_history(limit=1)[0]['momentum'][0] == 4.0
+        assert metrics.get_summary()['movement_count'] == 3
+
+    def test_movement_trajectory_optional(self):
+        """Test trajectories are only stored when enabled."""
+        trajectory = np.ones((3, 4), dtype=np.float32)
+
+        metrics = RobotMetrics(history_size=3)
+        metrics.record_movement([0.0, 0.0, 1.0, 0.0], trajectory=trajectory)
+        assert metrics.get_movement_history()[0]['trajectory'] is None
+
+        metrics = RobotMetrics(history_size=3, record_trajectories=True)
+        metrics.record_movement([0.0, 0.0, 1.0, 0.0], trajectory=trajectory)
+        assert metrics.get_movement_history()[0]['trajectory'] == trajectory.tolist()
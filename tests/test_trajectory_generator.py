@@ -0,0 +1,44 @@
+"""Tests for gait trajectory generation."""
+
+import pytest
+import numpy as np
+from src.gaits.trajectory_generator import TrajectoryGenerator
+
+
+class TestTrajectoryGenerator:
+    """Test trajectory generator."""
+
+    def test_matches_bezier_reference(self):
+        """Test generated samples match the bezier library curves."""
+        bezier = pytest.importorskip('bezier')
+        s_vals = np.linspace(0.0, 1.0, 20)
+        step_curve = bezier.Curve(np.asfortranarray([
+            [-1.0, -1.0, 1.0, 1.0],
+            [-1.0, -1.0, 1.0, 1.0],
+            [-15.0, -10.0, -10.0, -15.0],
+        ]), degree=3)
+        slide_curve = bezier.Curve(np.asfortranarray([
+            [1.0, -1.0],
+            [1.0, -1.0],
+            [-15.0, -15.0],
+        ]), degree=1)
+        expected = np.concatenate(
+            (step_curve.evaluate_multi(s_vals), slide_curve.evaluate_multi(s_vals)), axis=1
+        )
+
+        trajectory, length = TrajectoryGenerator(20).generate()
+
+        assert length == 40
+        assert trajectory.dtype == np.float32
+        assert np.allclose(trajectory, expected, atol=1e-5)
+
+    def test_generate_is_cached_per_resolution(self):
+        """Test repeated calls reuse the cached trajectory."""
+        generator = TrajectoryGenerator(20)
+        first, _ = generator.generate()
+        assert generator.generate()[0] is first
+
+        generator.step_resolution = 10
+        trajectory, length = generator.generate()
+        assert length == 20
+        assert trajectory is not first
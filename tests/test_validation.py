@@ -11,9 +11,8 @@ class TestQuadrupedValidation:
     """Test validation in Quadruped class."""
 
     @pytest.fixture
-    def mock_quadruped(self, mocker):
+    def mock_quadruped(self):
         """Create a mock Quadruped instance."""
-        mocker.patch('src.hardware.servo_controller.ServoKit')
         config = {
             'robot': {
                 'legs': {'upper_length': 10.0, 'lower_length': 10.5},
@@ -40,11 +39,37 @@ class TestQuadrupedValidation:
         with pytest.raises(ValidationError, match="out of range"):
             mock_quadruped.servo_controller.set_angle(0, 181)
 
+    def test_set_angles_invalid_batch(self, mock_quadruped):
+        """Test set_angles rejects a batch with any invalid motor_id or angle."""
+        servo_controller = mock_quadruped.servo_controller
+        with pytest.raises(ValidationError, match="Invalid motor_id"):
+            servo_controller.set_angles(np.array([0, 10]), np.array([90.0, 90.0]))
+
+        with pytest.raises(ValidationError, match="out of range"):
+            servo_controller.set_angles(np.array([0, 1]), np.array([90.0, np.nan]))
+
+    def test_calibrate_invalid_angle(self, mock_quadruped):
+        """Test servo calibration fails without moving any motor."""
+        servo_controller = mock_quadruped.servo_controller
+        written = []
+        servo_controller._write_angle = lambda *args: written.append(args)
+
+        assert servo_controller.calibrate({0: 90, 1: 200}) is False
+        assert written == []
+
     def test_leg_position_invalid_leg_id(self, mock_quadruped):
         """Test leg_position with invalid leg_id."""
         with pytest.raises(ValidationError, match="Invalid leg_id"):
             mock_quadruped.leg_position('XX', 0, -15)
 
+    def test_leg_position_y_too_small(self, mock_quadruped):
+        """Test leg_position refuses positions below the minimum y."""
+        calls = []
+        mock_quadruped.servo_controller.set_angle = lambda *args: calls.append(args)
+
+        assert mock_quadruped.leg_position('FR', 15.0, 0.0) is False
+        assert calls == []
+
     def test_inverse_positioning_invalid_coordinates(self, mock_quadruped):
         """Test inverse_positioning with invalid coordinates."""
         from src.kinematics.inverse_kinematics import InverseKinematics
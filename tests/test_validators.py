@@ -1,13 +1,16 @@
 """Tests for validation utilities."""
 
+import array
 import pytest
 import numpy as np
 from src.utils.validators import (
     validate_motor_id,
     validate_angle,
     validate_coordinate,
+    validate_xyz,
     validate_leg_id,
     validate_momentum,
+    validate_tick,
     validate_positive_number
 )
 from src.utils.exceptions import ValidationError
@@ -78,6 +81,30 @@ class TestCoordinateValidation:
         with pytest.raises(ValidationError, match="Invalid"):
             validate_coordinate("10")
 
+    def test_invalid_coordinate_not_finite(self):
+        """Test NaN and infinite coordinates."""
+        with pytest.raises(ValidationError, match="Invalid"):
+            validate_coordinate(float('nan'))
+        with pytest.raises(ValidationError, match="Invalid coordinates"):
+            validate_xyz(1.0, float('inf'), 0.0)
+
+    def test_invalid_coordinate_too_large(self):
+        """Test integers too large to convert to float."""
+        with pytest.raises(ValidationError, match="Invalid"):
+            validate_coordinate(10 ** 400)
+        with pytest.raises(ValidationError, match="Invalid coordinates"):
+            validate_xyz(0.0, 10 ** 400, 0.0)
+
+    def test_valid_xyz(self):
+        """Test valid coordinate triples, including numpy scalars."""
+        validate_xyz(0, 10.5, -5)
+        validate_xyz(np.float64(1.0), 2.0, 3)
+
+    def test_invalid_xyz(self):
+        """Test coordinate triple with a non-numeric component."""
+        with pytest.raises(ValidationError, match="Invalid coordinates"):
+            validate_xyz(1.0, "10", 0.0)
+
 
 class TestLegIdValidation:
     """Test leg ID validation."""
@@ -111,6 +138,16 @@ class TestMomentumValidation:
         momentum = [1.0, 0.5, 1.0, 0.0]
         validate_momentum(momentum)
 
+    def test_valid_momentum_array(self):
+        """Test valid array.array momentum."""
+        momentum = array.array('f', [1.0, 0.5, 1.0, 0.0])
+        validate_momentum(momentum)
+
+    def test_invalid_momentum_array_typecode(self):
+        """Test array.array with a non-numeric typecode."""
+        with pytest.raises(ValidationError, match="Invalid momentum type"):
+            validate_momentum(array.array('u', 'abcd'))
+
     def test_invalid_momentum_too_short(self):
         """Test momentum array too short."""
         momentum = np.array([1.0, 0.5], dtype=np.float32)
@@ -122,6 +159,56 @@ class TestMomentumValidation:
         with pytest.raises(ValidationError, match="Invalid momentum type"):
             validate_momentum("invalid")
 
+    def test_invalid_momentum_not_finite(self):
+        """Test momentum with NaN values."""
+        momentum = np.array([np.nan, 0.5, 1.0, 0.0], dtype=np.float32)
+        with pytest.raises(ValidationError, match="Invalid momentum values"):
+            validate_momentum(momentum)
+
+    @pytest.mark.parametrize("momentum", [
+        ["a", "b", "c", "d"],
+        [1, 2, 3, None],
+        np.array([1.0, 0.5, 1.0, None], dtype=object),
+    ])
+    def test_invalid_momentum_not_numeric(self, momentum):
+        """Test non-numeric momentum values."""
+        with pytest.raises(ValidationError, match="Must be numeric"):
+            validate_momentum(momentum)
+
+    def test_invalid_momentum_out_of_bounds(self):
+        """Test momentum exceeding bounds."""
+        momentum = np.array([1.0, 500.0, 1.0, 0.0], dtype=np.float32)
+        with pytest.raises(ValidationError, match="Invalid momentum values"):
+            validate_momentum(momentum)
+
+
+class TestTickValidation:
+    """Test per-cycle controller output validation."""
+
+    def test_valid_tick(self):
+        """Test valid float32 momentum takes the fast path."""
+        validate_tick(np.array([2.0, 0.5, 1.0, 1.0], dtype=np.float32))
+        validate_tick(np.array([-10.0, 10.0, 0.0, 0.0], dtype=np.float32))
+
+    def test_valid_tick_list(self):
+        """Test non-array momentum falls back to full validation."""
+        validate_tick([1.0, 0.5, 1.0, 0.0])
+
+    @pytest.mark.parametrize("values", [
+        [np.nan, 0.5, 1.0, 0.0],
+        [1.0, 500.0, 1.0, 0.0],
+        [1.0, 0.5, 1.0, np.inf],
+    ])
+    def test_invalid_tick(self, values):
+        """Test invalid momentum values are rejected."""
+        with pytest.raises(ValidationError, match="Invalid momentum values"):
+            validate_tick(np.array(values, dtype=np.float32))
+
+    def test_invalid_tick_too_short(self):
+        """Test short momentum array is rejected."""
+        with pytest.raises(ValidationError, match="Invalid momentum length"):
+            validate_tick(np.array([1.0, 0.5], dtype=np.float32))
+
 
 class TestPositiveNumberValidation:
     """Test positive number validation."""